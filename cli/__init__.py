@@ -1,6 +1,9 @@
 """CLI module for SigInt."""
 from .args import parse_args, create_parser, SigIntConfig
-from .commands import cmd_fingerprint, cmd_discover, cmd_verify, cmd_export, cmd_run
+
+# Command handlers are resolved lazily (PEP 562) so that argument parsing,
+# --help and argument errors don't pay for importing the phase engines.
+_COMMANDS = ("cmd_fingerprint", "cmd_discover", "cmd_verify", "cmd_export", "cmd_run", "cmd_config")
 
 __all__ = [
     "parse_args",
@@ -12,3 +15,10 @@ __all__ = [
     "cmd_export",
     "cmd_run",
 ]
+
+
+def __getattr__(name):
+    if name in _COMMANDS:
+        from . import commands
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """CLI argument parsing and configuration."""
 import argparse
+import functools
 from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
@@ -7,11 +8,35 @@ from pathlib import Path
 # Import defaults from config - single source of truth
 from config import Defaults
 
+# Defaults and help strings interpolated once at import (shared by several subparsers)
+_CACHE_TTL = Defaults.CACHE_TTL_DAYS
+_ENRICH_WORKERS = Defaults.ENRICH_WORKERS
+_VERIFY_WORKERS = Defaults.VERIFY_WORKERS
+_VERIFY_TIMEOUT = Defaults.VERIFY_TIMEOUT
+
+_HELP_CACHE_TTL = f"Cache TTL in days (default: {_CACHE_TTL})"
+_HELP_ENRICH_WORKERS = f"Concurrent enrichment workers (default: {_ENRICH_WORKERS})"
+_HELP_VERIFY_WORKERS = f"Concurrent verification workers (default: {_VERIFY_WORKERS})"
 
 # =============================================================================
 # Shared Argument Helpers (DRY - Don't Repeat Yourself)
 # =============================================================================
 
+def _csv(value: Optional[str]) -> List[str]:
+    """Split a comma-separated CLI value into stripped, non-empty items."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+_VALID_FORMATS = frozenset(("csv", "json", "html"))
+
+
+def _parse_formats(value: Optional[str]) -> List[str]:
+    """Parse a comma-separated export format list: valid formats, in order, once each."""
+    return list(dict.fromkeys(f for f in map(str.lower, _csv(value)) if f in _VALID_FORMATS))
+
+
 def _add_phase2_args(parser_or_group) -> None:
     """Add Phase 2 (Discovery) arguments to a parser or argument group.
     
@@ -41,8 +66,8 @@ def _add_phase2_args(parser_or_group) -> None:
         "--cache-ttl",
         metavar="DAYS",
         type=int,
-        default=Defaults.CACHE_TTL_DAYS,
-        help=f"Cache TTL in days (default: {Defaults.CACHE_TTL_DAYS})"
+        default=_CACHE_TTL,
+        help=_HELP_CACHE_TTL
     )
     parser_or_group.add_argument(
         "--skip-enrichment",
@@ -53,8 +78,8 @@ def _add_phase2_args(parser_or_group) -> None:
         "--enrich-workers",
         metavar="N",
         type=int,
-        default=Defaults.ENRICH_WORKERS,
-        help=f"Concurrent enrichment workers (default: {Defaults.ENRICH_WORKERS})"
+        default=_ENRICH_WORKERS,
+        help=_HELP_ENRICH_WORKERS
     )
     parser_or_group.add_argument(
         "--plugins",
@@ -74,17 +99,17 @@ def _add_phase3_args(parser_or_group) -> None:
         "--verify-workers", "-w",
         metavar="N",
         type=int,
-        default=Defaults.VERIFY_WORKERS,
+        default=_VERIFY_WORKERS,
         dest="verify_workers",
-        help=f"Concurrent verification workers (default: {Defaults.VERIFY_WORKERS})"
+        help=_HELP_VERIFY_WORKERS
     )
     parser_or_group.add_argument(
         "--verify-timeout", "-t",
         metavar="SECONDS",
         type=int,
-        default=Defaults.VERIFY_TIMEOUT,
+        default=_VERIFY_TIMEOUT,
         dest="verify_timeout",
-        help=f"Timeout per verification request (default: {Defaults.VERIFY_TIMEOUT})"
+        help=f"Timeout per verification request (default: {_VERIFY_TIMEOUT})"
     )
     parser_or_group.add_argument(
         "--skip-tls",
@@ -115,7 +140,7 @@ def _add_phase3_args(parser_or_group) -> None:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Phase1Config:
     """Phase 1 (Fingerprinting) configuration."""
     live_site: Optional[str] = None
@@ -146,7 +171,7 @@ class Phase1Config:
         return self.github_repo if self.github_repo else self.live_site
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Phase2Config:
     """Phase 2 (Discovery) configuration."""
     enabled: bool = True
@@ -159,7 +184,7 @@ class Phase2Config:
     plugins: Optional[List[str]] = None  # List of plugin names to use
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Phase3Config:
     """Phase 3 (Verification) configuration."""
     enabled: bool = True
@@ -171,7 +196,7 @@ class Phase3Config:
     interactive_weights: bool = False  # Interactive weight editor
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportConfig:
     """Export configuration."""
     formats: List[str] = field(default_factory=list)
@@ -180,7 +205,7 @@ class ExportConfig:
     include_all: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SigIntConfig:
     """Complete SigInt configuration."""
     phase1: Phase1Config
@@ -193,56 +218,49 @@ class SigIntConfig:
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> "SigIntConfig":
         """Create config from parsed arguments."""
+        d = vars(args)
+        
         # Phase 1
-        fingerprint_file = getattr(args, 'fingerprint', None)
+        fingerprint_file = d.get('fingerprint')
+        output = d['output']
         phase1 = Phase1Config(
-            live_site=getattr(args, 'live_site', None),
-            github_repo=getattr(args, 'github', None),
+            live_site=d.get('live_site'),
+            github_repo=d.get('github'),
             fingerprint_file=Path(fingerprint_file) if fingerprint_file else None,
-            output_path=Path(args.output) if args.output else None,
-            max_iterations=args.max_iterations,
-            mode=getattr(args, 'mode', 'application'),
-            include_version=getattr(args, 'include_version', False)
+            output_path=Path(output) if output else None,
+            max_iterations=d['max_iterations'],
+            mode=d.get('mode', 'application'),
+            include_version=d.get('include_version', False)
         )
         
         # Phase 2
-        # Parse plugins from comma-separated string
-        plugins_list = None
-        if getattr(args, 'plugins', None):
-            plugins_list = [p.strip() for p in args.plugins.split(',') if p.strip()]
-        
         phase2 = Phase2Config(
-            enabled=not args.skip_phase_2,
-            cache_strategy=args.cache_strategy,
-            cache_ttl_days=args.cache_ttl,
-            max_queries=args.max_queries,
-            max_candidates=args.max_candidates,
-            enrich=not args.skip_enrichment,
-            enrich_workers=args.enrich_workers,
-            plugins=plugins_list
+            enabled=not d['skip_phase_2'],
+            cache_strategy=d['cache_strategy'],
+            cache_ttl_days=d['cache_ttl'],
+            max_queries=d['max_queries'],
+            max_candidates=d['max_candidates'],
+            enrich=not d['skip_enrichment'],
+            enrich_workers=d['enrich_workers'],
+            plugins=_csv(d.get('plugins')) or None
         )
         
         # Phase 3
         phase3 = Phase3Config(
-            enabled=not args.skip_phase_3,
-            workers=args.verify_workers,
-            timeout=args.verify_timeout,
-            fetch_tls=not args.skip_tls,
-            tcp_check=not getattr(args, 'skip_tcp_check', False),
-            weights=getattr(args, 'weights', None),
-            interactive_weights=getattr(args, 'interactive_weights', False)
+            enabled=not d['skip_phase_3'],
+            workers=d['verify_workers'],
+            timeout=d['verify_timeout'],
+            fetch_tls=not d['skip_tls'],
+            tcp_check=not d.get('skip_tcp_check', False),
+            weights=d.get('weights'),
+            interactive_weights=d.get('interactive_weights', False)
         )
         
         # Export
-        export_formats = []
-        if args.export:
-            export_formats = [f.strip().lower() for f in args.export.split(",")]
-            export_formats = [f for f in export_formats if f in ("csv", "json", "html")]
-        
         export = ExportConfig(
-            formats=export_formats,
-            output_dir=Path(args.export_dir),
-            min_score=args.export_min_score
+            formats=_parse_formats(d['export']),
+            output_dir=Path(d['export_dir']),
+            min_score=d['export_min_score']
         )
         
         return cls(
@@ -250,8 +268,8 @@ class SigIntConfig:
             phase2=phase2,
             phase3=phase3,
             export=export,
-            verbose=args.verbose,
-            interactive=getattr(args, 'interactive', False)
+            verbose=d['verbose'],
+            interactive=d.get('interactive', False)
         )
 
 
@@ -315,6 +333,11 @@ Examples:
         action="store_true",
         help="Include version/year in fingerprint patterns (default: exclude)"
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Skip the fingerprint summary and only print the output path"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -340,6 +363,12 @@ def _add_discover_parser(subparsers) -> None:
         metavar="PATH",
         help="Output JSON file path (default: output/candidates/<app>_<run_id>_candidates.json)"
     )
+    parser.add_argument(
+        "--output-format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Candidates file format: json (single document) or ndjson (one host per line plus a .meta.json sidecar) (default: json)"
+    )
     
     # Add shared Phase 2 arguments
     _add_phase2_args(parser)
@@ -392,23 +421,23 @@ def _add_verify_parser(subparsers) -> None:
     parser.add_argument(
         "candidates_file",
         metavar="CANDIDATES",
-        help="Path to candidates JSON file"
+        help="Path to candidates JSON file (.ndjson files are read line by line)"
     )
     parser.add_argument(
         "-w", "--workers", "--verify-workers",
         metavar="N",
         type=int,
-        default=Defaults.VERIFY_WORKERS,
+        default=_VERIFY_WORKERS,
         dest="workers",
-        help=f"Concurrent verification workers (default: {Defaults.VERIFY_WORKERS})"
+        help=_HELP_VERIFY_WORKERS
     )
     parser.add_argument(
         "-t", "--timeout", "--verify-timeout",
         metavar="SECONDS",
         type=int,
-        default=Defaults.VERIFY_TIMEOUT,
+        default=_VERIFY_TIMEOUT,
         dest="timeout",
-        help=f"Timeout per request (default: {Defaults.VERIFY_TIMEOUT})"
+        help=f"Timeout per request (default: {_VERIFY_TIMEOUT})"
     )
     parser.add_argument(
         "--skip-tls",
@@ -629,11 +658,22 @@ def _add_config_parser(subparsers) -> None:
         default="./sigint.yaml",
         help="Output path for config file (default: ./sigint.yaml)"
     )
+    parser.add_argument(
+        "-f", "--force", "-y", "--yes",
+        action="store_true",
+        dest="force",
+        help="Overwrite an existing config file without prompting (init only)"
+    )
     parser.set_defaults(command="config")
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser with subcommands."""
+    """Create the main argument parser with subcommands.
+    
+    The parser is built once and reused; ``parse_args`` never mutates it,
+    so repeated calls (tests, embedding) skip rebuilding every subparser.
+    """
     parser = argparse.ArgumentParser(
         prog="sigint",
         description="SigInt - LLM-Driven Web Application Intelligence Pipeline",
@@ -693,14 +733,17 @@ Examples:
     return parser
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments.
     
+    Args:
+        argv: Optional argument list (defaults to sys.argv[1:])
+    
     Returns:
         Parsed arguments namespace
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # If no command specified, show help
     if not args.command:
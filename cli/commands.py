@@ -1,12 +1,23 @@
 """CLI subcommand implementations."""
 import json
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
-from core.models import FingerprintOutput
+from cli.args import _csv, _parse_formats
 from core.formatting import get_app_slug, print_fingerprint_summary
-from core.utils import utc_now_iso
-from discover.models import CandidateHost
-from verify.models import VerificationReport
+
+# Models, engines and hashing utilities are imported inside the commands that
+# need them, so `config`, `--help` and `--list-plugins` stay fast to start.
+
+_OUTPUT_DIRS = ("output/fingerprints", "output/candidates", "output/exports", "output/cache")
+
+
+@lru_cache(maxsize=1)
+def _ensure_output_dirs() -> None:
+    """Create the default output directories once per process."""
+    for directory in _OUTPUT_DIRS:
+        Path(directory).mkdir(parents=True, exist_ok=True)
 
 
 def cmd_fingerprint(args) -> int:
@@ -19,7 +30,7 @@ def cmd_fingerprint(args) -> int:
         Exit code (0 = success)
     """
     # Check if using GitHub repo fingerprinting
-    if getattr(args, 'github', None):
+    if args.github:
         return _fingerprint_github(args)
     else:
         return _fingerprint_live_site(args)
@@ -29,8 +40,8 @@ def _fingerprint_live_site(args) -> int:
     """Fingerprint a live website using LLM-driven analysis."""
     from fingerprint.engine import LLMFingerprintEngine
     
-    mode = getattr(args, 'mode', 'application')
-    include_version = getattr(args, 'include_version', False)
+    mode = args.mode
+    include_version = args.include_version
     
     print("\n" + "=" * 70)
     print("SigInt Phase 1 - LLM-Driven Recursive Fingerprinting")
@@ -45,35 +56,34 @@ def _fingerprint_live_site(args) -> int:
         include_version=include_version
     )
     
+    spec = output.fingerprint_spec
+    
     # Determine output path
     if args.output:
         output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
     else:
-        app_slug = get_app_slug(output.fingerprint_spec.app_name)
-        run_id = output.fingerprint_spec.run_id
-        output_path = Path("output/fingerprints") / f"{app_slug}_{run_id}.json"
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output.model_dump(), f, indent=2)
-    
-    spec = output.fingerprint_spec
-    plan = output.probe_plan
-    print_fingerprint_summary(
-        run_id=spec.run_id,
-        created_at=spec.created_at,
-        app_name=spec.app_name,
-        source=spec.source_location,
-        confidence=spec.confidence_level,
-        favicon=bool(spec.favicon),
-        key_images_count=len(spec.key_images),
-        page_signatures_count=len(spec.page_signatures),
-        probe_steps_count=len(plan.probe_steps),
-        min_matches=plan.minimum_matches_required,
-        distinctive_features=spec.distinctive_features,
-        fingerprint_mode=spec.fingerprint_mode,
-    )
+        _ensure_output_dirs()
+        output_path = Path("output/fingerprints") / f"{get_app_slug(spec.app_name)}_{spec.run_id}.json"
+    
+    output_path.write_bytes(output.model_dump_json(indent=2, exclude_none=True).encode())
+    
+    if not args.quiet:
+        plan = output.probe_plan
+        print_fingerprint_summary(
+            run_id=spec.run_id,
+            created_at=spec.created_at,
+            app_name=spec.app_name,
+            source=spec.source_location,
+            confidence=spec.confidence_level,
+            favicon=bool(spec.favicon),
+            key_images_count=len(spec.key_images),
+            page_signatures_count=len(spec.page_signatures),
+            probe_steps_count=len(plan.probe_steps),
+            min_matches=plan.minimum_matches_required,
+            distinctive_features=spec.distinctive_features,
+            fingerprint_mode=spec.fingerprint_mode,
+        )
     print(f"\n[✓] Fingerprint saved to: {output_path}")
     
     return 0
@@ -83,8 +93,8 @@ def _fingerprint_github(args) -> int:
     """Fingerprint a GitHub repository by analyzing static assets and structure."""
     from fingerprint.github_analyzer import GitHubAnalyzer
     
-    mode = getattr(args, 'mode', 'application')
-    include_version = getattr(args, 'include_version', False)
+    mode = args.mode
+    include_version = args.include_version
     
     analyzer = GitHubAnalyzer()
     output = analyzer.analyze_repo(
@@ -93,18 +103,17 @@ def _fingerprint_github(args) -> int:
         include_version=include_version
     )
     
+    spec = output.fingerprint_spec
+    
     # Determine output path
     if args.output:
         output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
     else:
-        app_slug = get_app_slug(output.fingerprint_spec.app_name)
-        run_id = output.fingerprint_spec.run_id
-        output_path = Path("output/fingerprints") / f"{app_slug}_{run_id}.json"
+        _ensure_output_dirs()
+        output_path = Path("output/fingerprints") / f"{get_app_slug(spec.app_name)}_{spec.run_id}.json"
     
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output.model_dump(), f, indent=2)
+    output_path.write_bytes(output.model_dump_json(indent=2, exclude_none=True).encode())
     
     print(f"\n[✓] Fingerprint saved to: {output_path}")
     print(f"[*] Use this fingerprint with 'sigint discover' to find instances")
@@ -121,10 +130,8 @@ def cmd_discover(args) -> int:
     Returns:
         Exit code (0 = success)
     """
-    from discover.engine import PassiveDiscovery
-    
     # Handle --list-plugins flag
-    if getattr(args, 'list_plugins', False):
+    if args.list_plugins:
         from discover.plugin_adapter import init_plugins, list_plugins, get_configured_plugins
         init_plugins()
         
@@ -145,29 +152,31 @@ def cmd_discover(args) -> int:
         print("=" * 70 + "\n")
         return 0
     
+    from core.models import FingerprintOutput
+    from core.utils import utc_now_iso, write_json, write_json_stream, write_ndjson
+    from discover.engine import PassiveDiscovery
+    from discover.models import DiscoveryHeader
+    
     # Load fingerprint
     fingerprint_path = Path(args.fingerprint_file)
     if not fingerprint_path.exists():
         print(f"[ERROR] Fingerprint file not found: {fingerprint_path}")
         return 1
     
-    with open(fingerprint_path) as f:
-        data = json.load(f)
-    
-    fingerprint = FingerprintOutput.model_validate(data)
+    fingerprint = FingerprintOutput.model_validate_json(fingerprint_path.read_bytes())
     
     print("\n" + "=" * 70)
     print("SigInt Phase 2 - Passive Discovery")
     print("=" * 70)
     print(f"[*] Fingerprint: {fingerprint_path}")
     spec = fingerprint.fingerprint_spec
-    target_label = "Organization" if getattr(spec, 'fingerprint_mode', 'application') == 'organization' else "Application"
+    app_slug = get_app_slug(spec.app_name)
+    run_id = spec.run_id
+    target_label = "Organization" if spec.fingerprint_mode == 'organization' else "Application"
     print(f"[*] {target_label}: {spec.app_name}")
     
     # Parse plugins if specified
-    plugin_names = None
-    if getattr(args, 'plugins', None):
-        plugin_names = [p.strip() for p in args.plugins.split(',')]
+    plugin_names = _csv(args.plugins) or None
     
     print(f"\n[*] Searching for similar instances...")
     print(f"    Max candidates: {args.max_candidates or 'unlimited'}")
@@ -180,61 +189,65 @@ def cmd_discover(args) -> int:
     )
     
     candidates = discovery.discover(
-        fingerprint=fingerprint.fingerprint_spec,
+        fingerprint=spec,
         max_results=args.max_candidates,
         max_queries=args.max_queries,
         cache_strategy=args.cache_strategy,
         plugins=plugin_names,
         enrich=not args.skip_enrichment,
         enrich_workers=args.enrich_workers,
-        interactive=getattr(args, 'interactive', False)
+        interactive=args.interactive
     )
     
     # Save candidates
     if args.output:
         output_path = Path(args.output)
+        if args.output_format == "ndjson" and output_path.suffix != ".ndjson":
+            # `verify` picks its reader by suffix, so keep NDJSON recognisable
+            output_path = output_path.with_suffix(".ndjson")
+            print(f"[*] NDJSON output, saving as: {output_path}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
     else:
-        app_slug = get_app_slug(fingerprint.fingerprint_spec.app_name)
-        run_id = fingerprint.fingerprint_spec.run_id
-        output_path = Path("output/candidates") / f"{app_slug}_{run_id}_candidates.json"
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Calculate geographic distribution
-    geo_dist = {}
-    for candidate in candidates:
-        country = candidate.location.get("country", "Unknown") if candidate.location else "Unknown"
-        geo_dist[country] = geo_dist.get(country, 0) + 1
+        _ensure_output_dirs()
+        suffix = "ndjson" if args.output_format == "ndjson" else "json"
+        output_path = Path("output/candidates") / f"{app_slug}_{run_id}_candidates.{suffix}"
+    
+    # Calculate geographic distribution (sorted once, most common first)
+    geo_counts = Counter((c.location or {}).get("country", "Unknown") for c in candidates).most_common()
+    geo_dist = dict(geo_counts)
+    
+    header = DiscoveryHeader(
+        fingerprint_run_id=run_id,
+        discovery_timestamp=utc_now_iso(),
+        total_candidates=len(candidates),
+        geographic_distribution=geo_dist
+    )
+    serialized = (c.model_dump_json(exclude_defaults=True).encode() for c in candidates)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "fingerprint_run_id": fingerprint.fingerprint_spec.run_id,
-            "discovery_timestamp": utc_now_iso(),
-            "total_candidates": len(candidates),
-            "geographic_distribution": dict(sorted(geo_dist.items(), key=lambda x: -x[1])),
-            "candidates": [c.model_dump() for c in candidates]
-        }, f, indent=2)
+    if args.output_format == "ndjson":
+        # One host per line, run metadata in a small sidecar file
+        write_ndjson(output_path, serialized)
+        write_json(output_path.with_suffix(".meta.json"), header)
+    else:
+        write_json_stream(output_path, header, "candidates", serialized)
     
     print(f"\n[✓] Found {len(candidates)} candidates")
     print(f"[✓] Saved to: {output_path}")
     
     if geo_dist:
         print(f"\nGeographic distribution:")
-        for country, count in sorted(geo_dist.items(), key=lambda x: -x[1])[:10]:
+        for country, count in geo_counts[:10]:
             print(f"  {country}: {count}")
     
     # Export candidates if requested
     export_formats = []
-    if getattr(args, 'export', None):
-        export_formats = [f.strip().lower() for f in args.export.split(",")]
-        export_formats = [f for f in export_formats if f in ("csv", "json", "html")]
+    if args.export:
+        export_formats = _parse_formats(args.export)
     
     if export_formats:
         from export.candidates_exporter import export_candidates
         
-        app_slug = get_app_slug(fingerprint.fingerprint_spec.app_name)
-        run_id = fingerprint.fingerprint_spec.run_id
-        export_dir = Path(getattr(args, 'export_dir', 'output/exports'))
+        export_dir = Path(args.export_dir)
         
         exported = export_candidates(
             candidates=candidates,
@@ -265,6 +278,8 @@ def cmd_verify(args) -> int:
     Returns:
         Exit code (0 = success)
     """
+    from core.models import FingerprintOutput
+    from discover.models import CandidateHost, CANDIDATE_LIST_ADAPTER
     from verify.engine import VerificationEngine
     
     # Load fingerprint
@@ -273,8 +288,7 @@ def cmd_verify(args) -> int:
         print(f"[ERROR] Fingerprint file not found: {fingerprint_path}")
         return 1
     
-    with open(fingerprint_path) as f:
-        fingerprint = FingerprintOutput.model_validate(json.load(f))
+    fingerprint = FingerprintOutput.model_validate_json(fingerprint_path.read_bytes())
     
     # Load candidates
     candidates_path = Path(args.candidates_file)
@@ -282,10 +296,21 @@ def cmd_verify(args) -> int:
         print(f"[ERROR] Candidates file not found: {candidates_path}")
         return 1
     
-    with open(candidates_path) as f:
-        data = json.load(f)
-    
-    candidates = [CandidateHost.model_validate(c) for c in data.get("candidates", [])]
+    if candidates_path.suffix == ".ndjson":
+        # Parse line by line - one host per line
+        with open(candidates_path, "rb") as f:
+            candidates = [CandidateHost.model_validate_json(line) for line in f if line.strip()]
+    else:
+        try:
+            data = json.loads(candidates_path.read_bytes())
+        except json.JSONDecodeError as e:
+            print(f"[ERROR] Candidates file is not a JSON document: {candidates_path} ({e})")
+            print("        NDJSON candidate files must use the .ndjson extension")
+            return 1
+        if not isinstance(data, dict):
+            print(f"[ERROR] Candidates file has no 'candidates' object: {candidates_path}")
+            return 1
+        candidates = CANDIDATE_LIST_ADAPTER.validate_python(data.get("candidates", []))
     
     if not candidates:
         print("[ERROR] No candidates found in file")
@@ -308,10 +333,10 @@ def cmd_verify(args) -> int:
     config_defaults = settings.get_probe_points_dict()
     fingerprint.probe_plan.apply_default_weights(config_defaults)
     
-    if getattr(args, 'interactive_weights', False):
+    if args.interactive_weights:
         # Show defaults, then let user customize
         fingerprint.probe_plan = interactive_weight_editor(fingerprint.probe_plan)
-    elif getattr(args, 'weights', None):
+    elif args.weights:
         # Override with user-specified weights
         weights = parse_weights_string(args.weights)
         apply_weights_to_plan(fingerprint.probe_plan, weights)
@@ -321,7 +346,7 @@ def cmd_verify(args) -> int:
         timeout=args.timeout,
         max_workers=args.workers,
         fetch_tls=not args.skip_tls,
-        tcp_check=not getattr(args, 'skip_tcp_check', False)
+        tcp_check=not args.skip_tcp_check
     )
     
     report = verifier.verify_candidates(
@@ -332,22 +357,20 @@ def cmd_verify(args) -> int:
     
     # Determine export formats: CLI arg > config file > none
     export_formats = []
-    if getattr(args, 'export', None):
-        export_formats = [f.strip().lower() for f in args.export.split(",")]
+    if args.export:
+        export_formats = _parse_formats(args.export)
     elif settings.export.default_formats:
         export_formats = settings.export.default_formats
     
     # Export results if formats specified
     if export_formats:
         from export.engine import export_report
-        from verify.models import VerificationReport
         
-        # Convert to VerificationReport if needed
         app_slug = get_app_slug(fingerprint.fingerprint_spec.app_name)
         run_id = fingerprint.fingerprint_spec.run_id
         
-        output_dir = Path(getattr(args, 'export_dir', None) or settings.export.output_dir)
-        min_score = getattr(args, 'min_score', settings.export.min_score)
+        output_dir = Path(args.export_dir or settings.export.output_dir)
+        min_score = args.min_score
         
         exported = export_report(
             report=report,
@@ -382,6 +405,7 @@ def cmd_export(args) -> int:
         Exit code (0 = success)
     """
     from export.engine import export_report
+    from verify.models import VerificationReport
     
     # Load verification report
     report_path = Path(args.report_file)
@@ -389,14 +413,10 @@ def cmd_export(args) -> int:
         print(f"[ERROR] Report file not found: {report_path}")
         return 1
     
-    with open(report_path) as f:
-        data = json.load(f)
-    
-    report = VerificationReport.model_validate(data)
+    report = VerificationReport.model_validate_json(report_path.read_bytes())
     
     # Parse formats
-    formats = [f.strip().lower() for f in args.formats.split(",")]
-    formats = [f for f in formats if f in ("csv", "json", "html")]
+    formats = _parse_formats(args.formats)
     
     if not formats:
         print("[ERROR] No valid formats specified. Use: csv, json, html")
@@ -455,19 +475,18 @@ def cmd_config(args) -> int:
     Returns:
         Exit code (0 = success)
     """
-    from pathlib import Path
     from config.settings import (
         get_settings, 
         create_default_config_file, 
         find_config_file
     )
     
-    action = getattr(args, 'action', 'show')
+    action = args.action
     
     if action == "init":
         # Create default config file
         output_path = Path(args.output)
-        if output_path.exists():
+        if output_path.exists() and not args.force:
             print(f"[!] Config file already exists: {output_path}")
             response = input("Overwrite? [y/N]: ").strip().lower()
             if response != 'y':
@@ -9,13 +9,17 @@ Configuration is loaded from (in order of precedence):
 IMPORTANT: All default values should be defined HERE only.
 Other modules should import from config to avoid duplication.
 """
+import copy
 import os
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from pydantic import BaseModel, Field
 from functools import lru_cache
 import yaml
 
+# libyaml's C loader when available; identical semantics to yaml.safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # =============================================================================
 # SINGLE SOURCE OF TRUTH: Default Values
@@ -195,32 +199,47 @@ class Settings(BaseModel):
 # Config File Loading
 # =============================================================================
 
+_HOME = os.path.expanduser("~")
+
+# Candidate config locations in search order (plain strings, built once)
+_CONFIG_LOCATIONS = (
+    "./sigint.yaml",
+    "./sigint.yml",
+    os.path.join(_HOME, ".sigint", "config.yaml"),
+    os.path.join(_HOME, ".sigint", "config.yml"),
+    os.path.join(_HOME, ".config", "sigint", "config.yaml"),
+)
+
+
+@lru_cache(maxsize=1)
 def find_config_file() -> Optional[Path]:
-    """Find config file in standard locations.
+    """Find config file in standard locations (cached for the process).
     
     Search order:
     1. ./sigint.yaml (current directory)
     2. ~/.sigint/config.yaml (user home)
     3. ~/.config/sigint/config.yaml (XDG config)
     """
-    locations = [
-        Path("./sigint.yaml"),
-        Path("./sigint.yml"),
-        Path.home() / ".sigint" / "config.yaml",
-        Path.home() / ".sigint" / "config.yml",
-        Path.home() / ".config" / "sigint" / "config.yaml",
-    ]
-    
-    for path in locations:
-        if path.exists():
-            return path
+    for location in _CONFIG_LOCATIONS:
+        try:
+            os.stat(location)
+        except OSError:
+            continue
+        return Path(location)
     
     return None
 
 
+# Parsed YAML keyed by path -> (st_mtime_ns, st_size, config)
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
 def load_config_file(path: Optional[Path] = None) -> Dict[str, Any]:
     """Load configuration from YAML file.
     
+    Parsed files are cached by modification time and size, so reloading an
+    unchanged file costs a single stat() instead of a YAML parse.
+    
     Args:
         path: Optional explicit path, otherwise searches standard locations
         
@@ -230,34 +249,54 @@ def load_config_file(path: Optional[Path] = None) -> Dict[str, Any]:
     if path is None:
         path = find_config_file()
     
-    if path is None or not path.exists():
+    if path is None:
+        return {}
+    
+    try:
+        st = os.stat(path)
+    except OSError:
         return {}
     
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+    
     try:
-        with open(path, "r") as f:
-            config = yaml.safe_load(f) or {}
-        return config
-    except Exception as e:
+        with open(path, "rb") as f:
+            config = yaml.load(f, Loader=_YAML_LOADER) or {}
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+        return copy.deepcopy(config)
+    except (OSError, yaml.YAMLError) as e:
+        # Reached once per file revision: get_settings caches on (path, mtime)
         print(f"[WARNING] Failed to load config file {path}: {e}")
         return {}
 
 
 def merge_config(base: Dict, override: Dict) -> Dict:
-    """Deep merge two config dictionaries."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_config(result[key], value)
-        else:
-            result[key] = value
+    """Deep merge two config dictionaries.
+    
+    Merges iteratively into a single copy of base (base is not modified).
+    """
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return result
 
 
-@lru_cache()
 def get_settings(config_file: Optional[str] = None) -> Settings:
     """Get settings instance (cached).
     
-    Loads from config file and environment variables.
+    Loads from config file and environment variables. The result is cached
+    per config file path and modification time, so repeated calls reuse the
+    same instance until the file changes on disk.
     
     Args:
         config_file: Optional explicit config file path
@@ -265,10 +304,30 @@ def get_settings(config_file: Optional[str] = None) -> Settings:
     Returns:
         Settings instance with merged configuration
     """
+    path = Path(config_file) if config_file else find_config_file()
+    return _load_settings(path, _mtime_ns(path))
+
+
+def _mtime_ns(path: Optional[Path]) -> Optional[int]:
+    """Return the file's modification time in ns, or None if missing."""
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_settings(path: Optional[Path], mtime_ns: Optional[int]) -> Settings:
+    """Build Settings from a config file; mtime_ns is part of the cache key."""
     # Load from file
-    file_config = load_config_file(Path(config_file) if config_file else None)
+    file_config = load_config_file(path) if path is not None else {}
     
-    # Create settings with file config
+    # Create settings with file config. Validation stays on purpose: the
+    # in-process lru_cache already skips it for an unchanged file, and an
+    # on-disk model_construct() blob would leave nested sections as plain
+    # dicts and persist any api keys from the YAML outside the config file.
     if file_config:
         settings = Settings.model_validate(file_config)
     else:
@@ -280,19 +339,8 @@ def get_settings(config_file: Optional[str] = None) -> Settings:
     return settings
 
 
-def create_default_config_file(path: Path = None) -> Path:
-    """Create a default config file with all options documented.
-    
-    Args:
-        path: Where to create the file (default: ./sigint.yaml)
-        
-    Returns:
-        Path to created file
-    """
-    if path is None:
-        path = Path("./sigint.yaml")
-    
-    default_config = """\
+# Documented default config written by `sigint config init` (encoded once)
+_DEFAULT_CONFIG_BYTES = """\
 # SigInt Configuration File
 # ========================
 # Place this file in:
@@ -372,11 +420,29 @@ output:
 #   censys_personal_access_token: "your-censys-pat"
 #   ipinfo_token: "your-ipinfo-token"
 #   openai_api_key: "your-openai-key"
-"""
+""".encode("utf-8")
+
+
+def create_default_config_file(path: Path = None) -> Path:
+    """Create a default config file with all options documented.
+    
+    Args:
+        path: Where to create the file (default: ./sigint.yaml)
+        
+    Returns:
+        Path to created file
+    """
+    if path is None:
+        path = Path("./sigint.yaml")
+    
+    parent = path.parent
+    if str(parent) not in ("", "."):
+        parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_DEFAULT_CONFIG_BYTES)
     
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        f.write(default_config)
+    # A new file may now shadow a previously found (or missing) config
+    find_config_file.cache_clear()
     
     return path
 
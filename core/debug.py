@@ -1,6 +1,23 @@
 """Debug utilities for SigInt."""
 import os
 
+_TRUTHY = ("1", "true", "yes")
+
+
+def _read_debug_env() -> bool:
+    """Resolve SIGINT_DEBUG from the environment."""
+    return os.environ.get("SIGINT_DEBUG", "").lower() in _TRUTHY
+
+
+# Resolved once at import; call reset_debug() after changing SIGINT_DEBUG
+_DEBUG = _read_debug_env()
+
+
+def reset_debug() -> None:
+    """Re-read SIGINT_DEBUG (e.g. after the CLI sets it for --verbose)."""
+    global _DEBUG
+    _DEBUG = _read_debug_env()
+
 
 def is_debug_mode() -> bool:
     """Check if debug mode is enabled.
@@ -8,10 +25,13 @@ def is_debug_mode() -> bool:
     Debug mode is enabled if:
     - SIGINT_DEBUG environment variable is set to "1", "true", or "yes"
     
+    The environment is read at import time (and by reset_debug()), not on
+    every call.
+    
     Returns:
         True if debug mode is enabled
     """
-    return os.environ.get("SIGINT_DEBUG", "").lower() in ("1", "true", "yes")
+    return _DEBUG
 
 
 def debug_print(message: str) -> None:
@@ -20,6 +40,5 @@ def debug_print(message: str) -> None:
     Args:
         message: Message to print
     """
-    if is_debug_mode():
+    if _DEBUG:
         print(message)
-
@@ -1,6 +1,16 @@
 """Shared formatting utilities."""
+import re
+import string
+import sys
 from typing import Optional
 
+# ASCII slug table: keep [a-z0-9], map every other code point below 128 to "_"
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = {i: (chr(i) if chr(i) in _SLUG_KEEP else "_") for i in range(128)}
+
+# Non-ASCII fallback: \W is exactly "not isalnum() and not underscore"
+_SLUG_RE = re.compile(r"\W")
+
 
 def get_app_slug(app_name: str) -> str:
     """Convert app name to filesystem-safe slug.
@@ -11,7 +21,10 @@ def get_app_slug(app_name: str) -> str:
     Returns:
         Slug (e.g., "damn_vulnerable_web_application")
     """
-    return "".join(c if c.isalnum() else "_" for c in app_name.lower())
+    lowered = app_name.lower()
+    if lowered.isascii():
+        return lowered.translate(_SLUG_TABLE)
+    return _SLUG_RE.sub("_", lowered)
 
 
 def print_section_header(title: str, char: str = "=", width: int = 70) -> None:
@@ -48,31 +61,33 @@ def print_fingerprint_summary(
         All the fingerprint details to display
         fingerprint_mode: Optional mode ('application' or 'organization')
     """
-    print("\n" + "=" * 70)
-    print("FINGERPRINT SUMMARY")
-    print("=" * 70)
-    print(f"Run ID: {run_id}")
-    print(f"Created: {created_at}")
     target_label = "Organization" if fingerprint_mode == "organization" else "Application"
-    print(f"\n{target_label}: {app_name}")
-    print(f"Source: {source}")
-    print(f"Confidence: {confidence.upper()}")
-    print(f"\nSignals collected:")
-    print(f"  - Favicon: {'✓' if favicon else '✗'}")
-    print(f"  - Key images: {key_images_count}")
-    print(f"  - Page signatures: {page_signatures_count}")
-    print(f"\nProbe plan: {probe_steps_count} steps")
-    print(f"Minimum matches required: {min_matches}")
+    lines = [
+        "",
+        "=" * 70,
+        "FINGERPRINT SUMMARY",
+        "=" * 70,
+        f"Run ID: {run_id}",
+        f"Created: {created_at}",
+        f"\n{target_label}: {app_name}",
+        f"Source: {source}",
+        f"Confidence: {confidence.upper()}",
+        f"\nSignals collected:",
+        f"  - Favicon: {'✓' if favicon else '✗'}",
+        f"  - Key images: {key_images_count}",
+        f"  - Page signatures: {page_signatures_count}",
+        f"\nProbe plan: {probe_steps_count} steps",
+        f"Minimum matches required: {min_matches}",
+    ]
     
     if distinctive_features:
-        print("\nDistinctive features:")
-        for feature in distinctive_features[:5]:
-            print(f"  • {feature}")
+        lines.append("\nDistinctive features:")
+        lines.extend(f"  • {feature}" for feature in distinctive_features[:5])
     
     if notes:
-        print(f"\nNotes: {notes}")
+        lines.append(f"\nNotes: {notes}")
     
-    print("=" * 70)
-    print("[✓] Phase 1 Complete!")
-    print("=" * 70)
-
+    lines += ["=" * 70, "[✓] Phase 1 Complete!", "=" * 70]
+    
+    # Emit the whole summary with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
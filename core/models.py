@@ -1,6 +1,7 @@
 """Data models for fingerprinting specifications and probe plans."""
-from typing import Optional, Dict, List, Literal, Union
-from pydantic import BaseModel, Field
+import re
+from typing import Optional, Dict, List, Literal, Pattern, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Import defaults from config - single source of truth
 from config import Defaults
@@ -11,20 +12,19 @@ class HashSet(BaseModel):
     sha256: Optional[str] = None
     md5: Optional[str] = None
     phash: Optional[str] = None  # Perceptual hash for images
-    mmh3: Optional[str] = None  # MurmurHash3 (used by Shodan)
-    mmh3_alt: List[str] = Field(default_factory=list)  # Alternative MMH3 hashes
+    mmh3: Optional[int] = None  # MurmurHash3 (used by Shodan); legacy string values coerce
+    mmh3_alt: List[int] = Field(default_factory=list)  # Alternative MMH3 hashes
     
     def __bool__(self) -> bool:
         """Return True if any hash is present."""
-        return any([self.sha256, self.md5, self.phash, self.mmh3])
+        # MMH3 is an int, so 0 is a real hash value
+        return bool(self.sha256 or self.md5 or self.phash or self.mmh3 is not None)
     
-    def get_all_mmh3(self) -> List[str]:
+    def get_all_mmh3(self) -> List[int]:
         """Get all MMH3 hashes (primary + alternatives)."""
-        hashes = []
-        if self.mmh3:
-            hashes.append(self.mmh3)
-        hashes.extend(self.mmh3_alt)
-        return hashes
+        if self.mmh3 is None:
+            return list(self.mmh3_alt)
+        return [self.mmh3, *self.mmh3_alt]
 
 
 class FaviconFingerprint(BaseModel):
@@ -53,14 +53,6 @@ class PageSignature(BaseModel):
         description="Regex patterns for distinctive text (simple keywords or OR patterns, matched case-insensitive)"
     )
     meta_tags: Optional[Dict[str, str]] = None  # Important meta tags
-    
-    def model_dump(self, **kwargs) -> dict:
-        """Override to exclude None values and empty lists."""
-        kwargs.setdefault('exclude_none', True)
-        data = super().model_dump(**kwargs)
-        if not data.get('body_patterns'):
-            data.pop('body_patterns', None)
-        return data
 
 
 class FingerprintSpec(BaseModel):
@@ -104,19 +96,6 @@ class FingerprintSpec(BaseModel):
         default=False,
         description="Whether version/year was included in fingerprint patterns"
     )
-    
-    def model_dump(self, **kwargs) -> dict:
-        """Override to exclude None values and empty lists."""
-        kwargs.setdefault('exclude_none', True)
-        data = super().model_dump(**kwargs)
-        # Remove empty lists
-        if not data.get('key_images'):
-            data.pop('key_images', None)
-        if not data.get('page_signatures'):
-            data.pop('page_signatures', None)
-        if not data.get('distinctive_features'):
-            data.pop('distinctive_features', None)
-        return data
 
 
 class ProbeStep(BaseModel):
@@ -170,10 +149,24 @@ class ProbeStep(BaseModel):
         description="Points awarded if this probe matches. Score = sum of matched points (capped at 100). Default: favicon=80, image=50, title=15, body=15"
     )
     
-    def model_dump(self, **kwargs) -> dict:
-        """Override to exclude None values for cleaner output."""
-        kwargs.setdefault('exclude_none', True)
-        return super().model_dump(**kwargs)
+    # Compiled page_signature patterns, built on first use and reused per host
+    _compiled_title: Optional[Pattern] = PrivateAttr(default=None)
+    _compiled_body: Optional[Tuple[Pattern, ...]] = PrivateAttr(default=None)
+    
+    def compiled_title(self) -> Optional[Pattern]:
+        """Get expected_title_pattern compiled case-insensitively (None if unset)."""
+        if self._compiled_title is None and self.expected_title_pattern:
+            self._compiled_title = re.compile(self.expected_title_pattern, re.IGNORECASE)
+        return self._compiled_title
+    
+    def compiled_body(self) -> Tuple[Pattern, ...]:
+        """Get expected_body_patterns compiled as case-insensitive literals."""
+        if self._compiled_body is None:
+            self._compiled_body = tuple(
+                re.compile(re.escape(p), re.IGNORECASE)
+                for p in (self.expected_body_patterns or ())
+            )
+        return self._compiled_body
 
 
 class ProbePlan(BaseModel):
@@ -247,6 +240,11 @@ class FingerprintOutput(BaseModel):
     probe_plan: ProbePlan
     
     def model_dump(self, **kwargs) -> dict:
-        """Override to exclude None values by default."""
+        """Override to exclude None values by default.
+        
+        This is the only override in the fingerprint tree: pydantic-core
+        serializes nested models itself, so per-class overrides on the spec,
+        signatures and steps never ran for a FingerprintOutput dump anyway.
+        """
         kwargs.setdefault('exclude_none', True)
         return super().model_dump(**kwargs)
@@ -1,11 +1,14 @@
 """Utility functions for hashing, content processing, and common patterns."""
 import hashlib
+import os
+import threading
 import mmh3
 import base64
+from collections import OrderedDict
 from datetime import datetime, timezone
-from io import BytesIO
-from PIL import Image
-import imagehash
+from pathlib import Path
+from typing import Any, Iterable
+import orjson
 
 
 def utc_now_iso() -> str:
@@ -17,6 +20,88 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+# Output files are written through a 1 MiB buffer so many small writes coalesce
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for types orjson doesn't handle natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Serialize data as indented JSON and write it to path in one call.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable object (dicts, lists, scalars, datetimes, Paths)
+    """
+    Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=_json_default))
+
+
+def write_json_stream(path: Path, header: dict, key: str, items: Iterable[bytes]) -> None:
+    """Write header fields followed by a JSON array under key, item by item.
+    
+    Items are written as they are produced, so large lists are never held
+    in memory as one list of dicts or one JSON buffer.
+    
+    Args:
+        path: Destination file path
+        header: Top-level fields written before the array (must be non-empty)
+        key: Name of the array field
+        items: Pre-serialized JSON values (one bytes object per element)
+    """
+    head = orjson.dumps(header, option=orjson.OPT_INDENT_2, default=_json_default)
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(head[:-2])  # Drop the closing "\n}" so the array can follow
+        f.write(b',\n  ' + orjson.dumps(key) + b': [')
+        empty = True
+        for item in items:
+            f.write(b"\n    " if empty else b",\n    ")
+            f.write(item)
+            empty = False
+        f.write(b"]\n}" if empty else b"\n  ]\n}")
+
+
+def write_ndjson(path: Path, items: Iterable[bytes]) -> None:
+    """Write pre-serialized JSON values to path, one per line (NDJSON).
+    
+    Args:
+        path: Destination file path
+        items: Pre-serialized JSON values (one bytes object per line)
+    """
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for item in items:
+            f.write(item)
+            f.write(b"\n")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to path so readers see either the old or the new file.
+    
+    Writes a sibling temp file and renames it over path with os.replace,
+    which is atomic on POSIX and on Windows within one volume. An
+    interrupted write leaves the previous file (or none), never a
+    truncated one. No fsync: callers use this for caches, where losing the
+    newest entry on power loss is acceptable.
+    
+    Args:
+        path: Destination file path
+        data: Complete file contents
+    """
+    path = Path(path)
+    # Unique per process and thread so concurrent writers never share a temp file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def calculate_hashes(content: bytes) -> dict:
     """Calculate multiple hash types for content.
     
@@ -26,12 +111,40 @@ def calculate_hashes(content: bytes) -> dict:
     Returns:
         Dictionary with sha256, md5, and mmh3 hashes
     """
-    hashes = {
+    # MD5 is only an asset identifier here; skip the FIPS security policy check
+    return {
         "sha256": hashlib.sha256(content).hexdigest(),
-        "md5": hashlib.md5(content).hexdigest(),
-        "mmh3": str(mmh3.hash(content))
+        "md5": hashlib.md5(content, usedforsecurity=False).hexdigest(),
+        "mmh3": mmh3.hash(content)
     }
-    return hashes
+
+
+# JPEG decode target for phash: well above the 32x32 DCT input so the
+# LANCZOS downsample inside imagehash sees effectively the same pixels
+_PHASH_DRAFT_SIZE = (128, 128)
+
+
+def calculate_phash(image_content: bytes) -> str:
+    """Calculate the perceptual hash (phash) of an image.
+    
+    JPEGs are decoded in draft mode (libjpeg DCT scaling, grayscale) since
+    phash only looks at a 32x32 grayscale thumbnail; other formats decode
+    normally.
+    
+    Args:
+        image_content: Raw image bytes
+        
+    Returns:
+        Hex-encoded 64-bit perceptual hash
+    """
+    # Deferred: PIL and imagehash (numpy/scipy) are only needed for images
+    from io import BytesIO
+    from PIL import Image
+    import imagehash
+    
+    img = Image.open(BytesIO(image_content))
+    img.draft("L", _PHASH_DRAFT_SIZE)
+    return str(imagehash.phash(img))
 
 
 def calculate_image_hashes(image_content: bytes) -> dict:
@@ -47,8 +160,7 @@ def calculate_image_hashes(image_content: bytes) -> dict:
     
     # Add perceptual hash for images
     try:
-        img = Image.open(BytesIO(image_content))
-        hashes["phash"] = str(imagehash.phash(img))
+        hashes["phash"] = calculate_phash(image_content)
     except Exception as e:
         print(f"Warning: Could not calculate perceptual hash: {e}")
         hashes["phash"] = None
@@ -56,18 +168,47 @@ def calculate_image_hashes(image_content: bytes) -> dict:
     return hashes
 
 
-def calculate_favicon_mmh3(content: bytes) -> str:
+# Favicon hash memo: hosting fleets serve the same favicon from thousands of
+# hosts. Keyed on the SHA-1 digest so the memo never holds response bodies
+# (which come from untrusted hosts); bodies over the cap are not memoized.
+_FAVICON_MEMO_SIZE = 128
+_FAVICON_MEMO_MAX_BYTES = 64 * 1024
+_favicon_memo: "OrderedDict[bytes, int]" = OrderedDict()
+_favicon_memo_lock = threading.Lock()
+
+
+def calculate_favicon_mmh3(content: bytes) -> int:
     """Calculate Shodan-style favicon hash (base64 encoded MMH3).
     
     This matches the format used by Shodan's http.favicon.hash field.
+    Results for favicons up to 64 KiB are memoized by content digest, so
+    repeats skip the base64 + hash work.
     
     Args:
         content: Raw favicon bytes
         
     Returns:
-        Base64-encoded MurmurHash3 hash as string
+        Signed 32-bit MurmurHash3 of the base64-encoded content
     """
+    if len(content) > _FAVICON_MEMO_MAX_BYTES:
+        return _favicon_mmh3(content)
+    
+    key = hashlib.sha1(content, usedforsecurity=False).digest()
+    with _favicon_memo_lock:
+        cached = _favicon_memo.get(key)
+        if cached is not None:
+            _favicon_memo.move_to_end(key)
+            return cached
+    
+    value = _favicon_mmh3(content)
+    with _favicon_memo_lock:
+        _favicon_memo[key] = value
+        if len(_favicon_memo) > _FAVICON_MEMO_SIZE:
+            _favicon_memo.popitem(last=False)
+    return value
+
+
+def _favicon_mmh3(content: bytes) -> int:
+    """Shodan favicon hash without memoization."""
     # Shodan uses base64 encoding, then calculates MMH3 hash
-    b64_content = base64.encodebytes(content)
-    favicon_hash = mmh3.hash(b64_content)
-    return str(favicon_hash)
\ No newline at end of file
+    return mmh3.hash(base64.encodebytes(content))
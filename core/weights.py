@@ -1,4 +1,5 @@
 """Probe points management utilities for additive scoring."""
+import sys
 from typing import Dict
 from core.models import ProbePlan
 
@@ -58,31 +59,46 @@ def apply_weights_to_plan(plan: ProbePlan, weights: Dict[str, int]) -> None:
             plan.set_probe_weight(type_map[key], weight)
 
 
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+_ROW_FMT = "{:>3}  {:<18}  {:<30}  {:>6}".format
+_TOTAL_FMT = "{:<55}  {:>6}".format
+
+
 def print_probe_weights(plan: ProbePlan) -> None:
     """Print current probe points in a formatted table.
     
+    The table is assembled first and written in a single call.
+    
     Args:
         plan: The probe plan to display
     """
-    print("\n" + "=" * 70)
-    print("PROBE POINTS (Additive Scoring)")
-    print("=" * 70)
-    print(f"{'#':>3}  {'Type':<18}  {'Path':<30}  {'Points':>6}")
-    print("-" * 70)
+    lines = [
+        "",
+        _RULE,
+        "PROBE POINTS (Additive Scoring)",
+        _RULE,
+        _ROW_FMT("#", "Type", "Path", "Points"),
+        _THIN_RULE,
+    ]
     
     total_points = 0
     for step in plan.probe_steps:
         total_points += step.weight
-        print(f"{step.order:>3}  {step.check_type:<18}  {step.url_path:<30}  {step.weight:>6}")
+        lines.append(_ROW_FMT(step.order, step.check_type, step.url_path, step.weight))
     
-    print("-" * 70)
-    print(f"{'Max possible score':<55}  {total_points:>6}")
-    print(f"{'Verified threshold':<55}  {'80':>6}")
-    print(f"{'Max score cap':<55}  {'100':>6}")
-    print("=" * 70)
-    print("Score = sum of matched probe points (capped at 100)")
-    print("Early termination: stops probing when score reaches 100")
-    print("=" * 70)
+    lines += [
+        _THIN_RULE,
+        _TOTAL_FMT("Max possible score", total_points),
+        _TOTAL_FMT("Verified threshold", "80"),
+        _TOTAL_FMT("Max score cap", "100"),
+        _RULE,
+        "Score = sum of matched probe points (capped at 100)",
+        "Early termination: stops probing when score reaches 100",
+        _RULE,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def interactive_weight_editor(plan: ProbePlan) -> ProbePlan:
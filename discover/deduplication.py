@@ -11,13 +11,25 @@ def deduplicate_candidates(candidates: List[CandidateHost]) -> List[CandidateHos
         
     Returns:
         List of unique candidates with merged data
+    
+    Note:
+        The first candidate seen for each key is merged into in place.
     """
-    seen = {}
-    for candidate in candidates:
-        key = candidate.key
-        if key in seen:
-            seen[key] = seen[key].merge_with(candidate)
+    # Index pass reads only (ip, port) -- same identity as CandidateHost.key
+    # without building an f-string per candidate; models merge once per key
+    keys = [(c.ip, c.port) for c in candidates]
+    unique_idx = {}
+    groups: List[List[int]] = []
+    for i, key in enumerate(keys):
+        j = unique_idx.get(key)
+        if j is None:
+            unique_idx[key] = len(groups)
+            groups.append([i])
         else:
-            seen[key] = candidate
+            groups[j].append(i)
     
-    return list(seen.values())
+    return [
+        candidates[group[0]] if len(group) == 1
+        else CandidateHost.merge_group([candidates[i] for i in group])
+        for group in groups
+    ]
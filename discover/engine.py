@@ -1,9 +1,18 @@
 """Main passive discovery engine with query-level caching and plugin support."""
-import json
-from typing import List, Optional, Literal, Tuple
+import mmap
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Literal, Tuple
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
-from core.utils import utc_now_iso
+from datetime import datetime, timezone
+import orjson
+from core.utils import utc_now_iso, write_bytes_atomic
 
 from core.models import FingerprintSpec
 from .models import CandidateHost, QueryCache
@@ -13,8 +22,29 @@ from .deduplication import deduplicate_candidates
 from config import Defaults
 
 
+# Cache files at least this large are parsed from an mmap (smaller reads are
+# cheaper than setting up a mapping)
+_MMAP_MIN_SIZE = 1 << 20
+
+# Serializes per-query status output from concurrent plugin workers
+_STATUS_LOCK = threading.Lock()
+
+
+def _status(*lines: str) -> None:
+    """Write a status block in one call so plugin workers never interleave it."""
+    block = "\n".join(lines) + "\n"
+    with _STATUS_LOCK:
+        sys.stdout.write(block)
+        sys.stdout.flush()
+
+
+@lru_cache(maxsize=1)
 def _init_plugins():
-    """Initialize the plugin system (lazy load to avoid circular imports)."""
+    """Initialize the plugin system once per process.
+    
+    Imported lazily (avoids circular imports) and only on the first
+    discover() call, so cache maintenance never loads the plugins.
+    """
     from .plugin_adapter import init_plugins
     init_plugins()
 
@@ -25,6 +55,12 @@ class PassiveDiscovery:
     Uses plugins (Shodan, Censys, etc.) for discovery.
     Plugins are auto-discovered and configured via environment variables.
     
+    Query results are cached as one "query_<hash>.json" file per
+    (platform, query) pair. Lookups go straight to that path; only
+    cache_stats() and clear_cache() scan the directory, and they read
+    metadata keys without validating the cached candidates. The files are
+    the only source of truth, so users can inspect or delete them freely.
+    
     Example:
         discovery = PassiveDiscovery()
         candidates = discovery.discover(fingerprint)
@@ -47,9 +83,6 @@ class PassiveDiscovery:
         self.cache_dir.mkdir(exist_ok=True, parents=True)
         self.cache_ttl_days = cache_ttl_days
         self.plugin_names = plugin_names
-        
-        # Always initialize plugins
-        _init_plugins()
     
     def discover(
         self,
@@ -88,6 +121,7 @@ class PassiveDiscovery:
         )
         from plugins.discovery import PluginRegistry
         
+        _init_plugins()
         plugin_names = plugins or self.plugin_names
         
         print(f"\n{'='*70}")
@@ -127,47 +161,39 @@ class PassiveDiscovery:
                 return []
             print(f"\n[Interactive] {len(queries)} queries approved for execution")
         
+        # Plugins run concurrently (one worker each, since every API sits
+        # behind its own rate limit); each plugin's queries stay sequential
+        # Ask each plugin once per distinct query type, keeping query priority order
+        query_types = {q.query_type for q in queries}
+        plugin_tasks = []
+        for plugin in plugin_instances:
+            supported = {t for t in query_types if plugin.supports_query_type(t)}
+            plugin_queries = [q for q in queries if q.query_type in supported]
+            if plugin_queries:
+                print(f"\n[{plugin.name.upper()}] Processing {len(plugin_queries)} queries...")
+                plugin_tasks.append((plugin, plugin_queries))
+        
+        abort_event = threading.Event()
+        prompt_lock = threading.Lock()
+        
+        def run(task):
+            plugin, plugin_queries = task
+            return self._run_plugin_queries(plugin, plugin_queries, cache_strategy, abort_event, prompt_lock)
+        
+        if len(plugin_tasks) > 1:
+            with ThreadPoolExecutor(max_workers=len(plugin_tasks)) as executor:
+                task_results = list(executor.map(run, plugin_tasks))
+        else:
+            task_results = [run(task) for task in plugin_tasks]
+        
+        # Merge in plugin order so dedup (first seen wins) stays deterministic
         all_candidates: List[CandidateHost] = []
         cached_count = 0
         fresh_count = 0
-        
-        # Execute queries for each plugin
-        abort_discovery = False
-        for plugin in plugin_instances:
-            if abort_discovery:
-                break
-                
-            plugin_queries = [q for q in queries if plugin.supports_query_type(q.query_type)]
-            if not plugin_queries:
-                continue
-                
-            print(f"\n[{plugin.name.upper()}] Processing {len(plugin_queries)} queries...")
-            
-            for query in plugin_queries:
-                candidates, from_cache, error = self._execute_query_with_cache(
-                    plugin=plugin,
-                    query=query,
-                    cache_strategy=cache_strategy,
-                    max_results_per_query=None  # Get all results per query, limit total after dedupe
-                )
-                all_candidates.extend(candidates)
-                if from_cache:
-                    cached_count += 1
-                else:
-                    fresh_count += 1
-                
-                # If error occurred, ask user if they want to continue
-                if error:
-                    try:
-                        response = input("\n[?] Query error occurred. Continue with remaining queries? [y/N]: ").strip().lower()
-                        if response not in ('y', 'yes'):
-                            print("[!] Discovery aborted by user")
-                            abort_discovery = True
-                            break
-                    except (EOFError, KeyboardInterrupt):
-                        print("\n[!] Discovery aborted")
-                        abort_discovery = True
-                        break
+        for candidates, cached, fresh in task_results:
+            all_candidates.extend(candidates)
+            cached_count += cached
+            fresh_count += fresh
         
         print(f"\n[Cache Summary] {cached_count} queries from cache, {fresh_count} fresh API calls")
         
@@ -177,10 +203,7 @@ class PassiveDiscovery:
         print(f"[Dedupe] {len(deduplicated):,} unique IP:PORT combinations after deduplication")
         
         # Count sources
-        source_counts = {}
-        for c in deduplicated:
-            for src in c.sources:
-                source_counts[src] = source_counts.get(src, 0) + 1
+        source_counts = Counter(chain.from_iterable(c.sources for c in deduplicated))
         if source_counts:
             print(f"[Dedupe] By source: {' | '.join(f'{s}: {n}' for s, n in source_counts.items())}")
         
@@ -194,6 +217,67 @@ class PassiveDiscovery:
         
         return result
     
+    def _run_plugin_queries(
+        self,
+        plugin,
+        plugin_queries: List,
+        cache_strategy: Literal["cache_only", "new_only", "cache_and_new"],
+        abort_event: threading.Event,
+        prompt_lock: threading.Lock
+    ) -> Tuple[List[CandidateHost], int, int]:
+        """Execute one plugin's queries in order, stopping if discovery is aborted.
+        
+        Args:
+            plugin: The discovery plugin to use
+            plugin_queries: Queries supported by this plugin
+            cache_strategy: Caching strategy to use
+            abort_event: Set when the user aborts discovery (shared across plugins)
+            prompt_lock: Serializes the continue-on-error prompt between plugins
+            
+        Returns:
+            Tuple of (candidates list, cached query count, fresh query count)
+        """
+        candidates_out: List[CandidateHost] = []
+        cached_count = 0
+        fresh_count = 0
+        
+        for query in plugin_queries:
+            if abort_event.is_set():
+                break
+            
+            candidates, from_cache, error = self._execute_query_with_cache(
+                plugin=plugin,
+                query=query,
+                cache_strategy=cache_strategy,
+                max_results_per_query=None  # Get all results per query, limit total after dedupe
+            )
+            candidates_out.extend(candidates)
+            if from_cache:
+                cached_count += 1
+            else:
+                fresh_count += 1
+            
+            # If error occurred, ask user if they want to continue. Without a
+            # usable stdin, input() raises EOFError and discovery aborts on the
+            # first error, so batch runs never prompt twice; piped answers
+            # (e.g. `yes |`) keep working, which an isatty() gate would break.
+            if error:
+                with prompt_lock:
+                    if abort_event.is_set():
+                        break
+                    try:
+                        response = input("\n[?] Query error occurred. Continue with remaining queries? [y/N]: ").strip().lower()
+                        if response not in ('y', 'yes'):
+                            print("[!] Discovery aborted by user")
+                            abort_event.set()
+                            break
+                    except (EOFError, KeyboardInterrupt):
+                        print("\n[!] Discovery aborted")
+                        abort_event.set()
+                        break
+        
+        return candidates_out, cached_count, fresh_count
+    
     def _interactive_query_review(self, queries: List) -> List:
         """Interactively review and approve/deny/modify each discovery query.
         
@@ -318,11 +402,11 @@ class PassiveDiscovery:
         Returns:
             Tuple of (candidates list, was_from_cache boolean, error message or None)
         """
-        from .plugin_adapter import normalized_host_to_candidate
+        from .plugin_adapter import normalized_hosts_to_candidates
         
-        # Create cache key from plugin name + query
-        cache_key = f"{plugin.name}_{query.query_type.value}_{hash(query.value)}"
-        query_hash = QueryCache.hash_query(plugin.name, f"{query.query_type.value}:{query.value}")
+        # Cache key: hash of plugin name + query string (built and hashed once)
+        query_string = f"{query.query_type.value}:{query.value}"
+        query_hash = QueryCache.hash_query(plugin.name, query_string)
         cache_file = self.cache_dir / f"query_{query_hash}.json"
         
         query_label = query.metadata.get('source', query.query_type.value)
@@ -336,15 +420,15 @@ class PassiveDiscovery:
             cached = self._load_query_cache(cache_file)
             if cached:
                 # Calculate age for display
-                cache_time = datetime.fromisoformat(cached.query_timestamp.replace("Z", "+00:00"))
-                age_days = (datetime.now(timezone.utc) - cache_time).days
-                print(f"    {platform_tag} ({query_label}) {display_value} → {cached.result_count} results (cached, {age_days}d old)")
+                cache_epoch = cached.query_timestamp_epoch or self._iso_to_epoch(cached.query_timestamp)
+                age_days = int((time.time() - cache_epoch) // 86400)
+                _status(f"    {platform_tag} ({query_label}) {display_value} → {cached.result_count} results (cached, {age_days}d old)")
                 return cached.candidates, True, None
             elif cache_strategy == "cache_only":
                 if cache_file.exists():
-                    print(f"    {platform_tag} ({query_label}) {display_value} → EXPIRED")
+                    _status(f"    {platform_tag} ({query_label}) {display_value} → EXPIRED")
                 else:
-                    print(f"    {platform_tag} ({query_label}) {display_value} → NO CACHE")
+                    _status(f"    {platform_tag} ({query_label}) {display_value} → NO CACHE")
                 return [], True, None
         
         # Execute fresh query
@@ -359,54 +443,84 @@ class PassiveDiscovery:
             
             if result.success:
                 # Convert NormalizedHost to CandidateHost
-                candidates = [normalized_host_to_candidate(h) for h in result.hosts]
-                print(f"    {platform_tag} ({query_label}) {display_value} → {len(candidates)} results")
+                candidates = normalized_hosts_to_candidates(result.hosts)
+                _status(f"    {platform_tag} ({query_label}) {display_value} → {len(candidates)} results")
                 
                 # Save to cache
                 self._save_query_cache(
                     cache_file, 
                     plugin.name, 
                     query_label,
-                    f"{query.query_type.value}:{query.value}",
-                    candidates
+                    query_string,
+                    candidates,
+                    query_hash=query_hash
                 )
             else:
                 error_msg = result.error
                 full_query = plugin.translate_query(query)
-                print(f"    {platform_tag} ({query_label}) {display_value} → ERROR:")
-                print(f"          Query: {full_query}")
-                print(f"          Reason: {result.error}")
+                _status(
+                    f"    {platform_tag} ({query_label}) {display_value} → ERROR:",
+                    f"          Query: {full_query}",
+                    f"          Reason: {result.error}",
+                )
                 
         except Exception as e:
             error_msg = str(e)
             try:
                 full_query = plugin.translate_query(query)
             except:
-                full_query = f"{query.query_type.value}:{query.value}"
-            print(f"    {platform_tag} ({query_label}) {display_value} → ERROR:")
-            print(f"          Query: {full_query}")
-            print(f"          Reason: {e}")
+                full_query = query_string
+            _status(
+                f"    {platform_tag} ({query_label}) {display_value} → ERROR:",
+                f"          Query: {full_query}",
+                f"          Reason: {e}",
+            )
         
         return candidates, False, error_msg
     
+    @staticmethod
+    def _read_cache_data(cache_file: Path) -> dict:
+        """Parse a cache file into a plain dict (no model validation).
+        
+        Large files are parsed straight from a read-only memory map instead
+        of being copied into a bytes object first.
+        """
+        with open(cache_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    
+    @staticmethod
+    def _iso_to_epoch(timestamp: str) -> float:
+        """Convert an ISO timestamp ("...Z" allowed) to Unix seconds."""
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    
+    @classmethod
+    def _cache_epoch(cls, data: dict) -> float:
+        """Get the query time of raw cache data as Unix seconds.
+        
+        Uses the stored epoch; only caches written before it existed need
+        their ISO timestamp parsed.
+        """
+        epoch = data.get("query_timestamp_epoch")
+        return epoch if epoch is not None else cls._iso_to_epoch(data["query_timestamp"])
+    
+    def _is_expired(self, cache_epoch: float, now: float) -> bool:
+        """Check a cache time against the TTL (0 = no expiration)."""
+        return self.cache_ttl_days > 0 and now - cache_epoch > self.cache_ttl_days * 86400
+    
     def _load_query_cache(self, cache_file: Path) -> Optional[QueryCache]:
-        """Load a cached query result if valid and not expired."""
-        if not cache_file.exists():
-            return None
+        """Load a cached query result if valid and not expired.
         
+        The TTL is checked on the raw dict; the model (and its candidates)
+        is only validated for entries that are actually returned.
+        """
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            cache = QueryCache(**data)
-            
-            # Check TTL expiration (0 = no expiration)
-            if self.cache_ttl_days > 0:
-                cache_time = datetime.fromisoformat(cache.query_timestamp.replace("Z", "+00:00"))
-                age = datetime.now(timezone.utc) - cache_time
-                if age > timedelta(days=self.cache_ttl_days):
-                    return None  # Cache expired
-            
-            return cache
+            data = self._read_cache_data(cache_file)
+            if self._is_expired(self._cache_epoch(data), time.time()):
+                return None  # Cache expired
+            return QueryCache.model_validate(data)
         except Exception:
             return None
     
@@ -416,21 +530,58 @@ class PassiveDiscovery:
         platform: str,
         query_type: str,
         query_string: str,
-        candidates: List[CandidateHost]
+        candidates: List[CandidateHost],
+        query_hash: Optional[str] = None
     ):
-        """Save query results to cache."""
+        """Save query results to cache.
+        
+        Called once per fresh query, before deduplication, with candidates
+        built for that query alone; nothing is shared across saves, so each
+        entry is serialized directly by pydantic-core.
+        
+        query_hash may be passed when the caller already computed it.
+        """
+        now = datetime.now(timezone.utc)
         cache = QueryCache(
-            query_hash=QueryCache.hash_query(platform, query_string),
+            query_hash=query_hash or QueryCache.hash_query(platform, query_string),
             platform=platform,
             query_type=query_type,
             query_string=query_string,
-            query_timestamp=utc_now_iso(),
+            query_timestamp=now.isoformat().replace("+00:00", "Z"),
+            query_timestamp_epoch=int(now.timestamp()),
             result_count=len(candidates),
             candidates=candidates
         )
         
-        with open(cache_file, 'w') as f:
-            json.dump(cache.model_dump(), f, indent=2)
+        # Machine-read only: compact JSON straight from pydantic-core. Written
+        # atomically so an interrupted run never leaves a truncated entry
+        # (which would be treated as a miss and re-spend API credits).
+        write_bytes_atomic(cache_file, cache.model_dump_json(exclude_none=True).encode())
+    
+    @classmethod
+    def _peek_cache_file(cls, cache_file: Path) -> Optional[Tuple[str, float, int]]:
+        """Read just (platform, query epoch, result_count) from a cache file.
+        
+        Returns:
+            Metadata tuple, or None if the file is unreadable or malformed
+        """
+        try:
+            data = cls._read_cache_data(cache_file)
+            return data["platform"], cls._cache_epoch(data), data["result_count"]
+        except Exception:
+            return None
+    
+    def _scan_cache_files(self) -> List[Tuple[Path, Optional[Tuple[str, float, int]]]]:
+        """Peek every cache file's metadata, reading files in parallel.
+        
+        File reads release the GIL, so a thread pool helps on large or cold
+        cache directories. Aggregation is left to the calling thread.
+        """
+        files = list(self.cache_dir.glob("query_*.json"))
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            return list(zip(files, executor.map(self._peek_cache_file, files)))
     
     def clear_cache(self, expired_only: bool = False):
         """Clear cached query results.
@@ -441,25 +592,18 @@ class PassiveDiscovery:
         cleared = 0
         kept = 0
         
-        for cache_file in self.cache_dir.glob("query_*.json"):
-            try:
-                if expired_only:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                    cache = QueryCache(**data)
-                    cache_time = datetime.fromisoformat(cache.query_timestamp.replace("Z", "+00:00"))
-                    age = datetime.now(timezone.utc) - cache_time
-                    
-                    if self.cache_ttl_days > 0 and age > timedelta(days=self.cache_ttl_days):
-                        cache_file.unlink()
-                        cleared += 1
-                    else:
-                        kept += 1
-                else:
-                    cache_file.unlink()
+        if expired_only:
+            now = time.time()
+            for cache_file, meta in self._scan_cache_files():
+                # Unreadable entries are cleared along with expired ones
+                if meta is None or self._is_expired(meta[1], now):
+                    cache_file.unlink(missing_ok=True)
                     cleared += 1
-            except Exception:
-                cache_file.unlink()
+                else:
+                    kept += 1
+        else:
+            for cache_file in self.cache_dir.glob("query_*.json"):
+                cache_file.unlink(missing_ok=True)
                 cleared += 1
         
         if expired_only:
@@ -469,7 +613,7 @@ class PassiveDiscovery:
     
     def cache_stats(self) -> dict:
         """Get cache statistics."""
-        now = datetime.now(timezone.utc)
+        now = time.time()
         stats = {
             "total_queries": 0,
             "total_candidates": 0,
@@ -479,31 +623,32 @@ class PassiveDiscovery:
             "oldest_cache": None,
             "newest_cache": None
         }
+        oldest = newest = None
         
-        for cache_file in self.cache_dir.glob("query_*.json"):
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                cache = QueryCache(**data)
-                
-                stats["total_queries"] += 1
-                stats["total_candidates"] += cache.result_count
-                stats["by_platform"][cache.platform] = stats["by_platform"].get(cache.platform, 0) + 1
-                
-                cache_time = datetime.fromisoformat(cache.query_timestamp.replace("Z", "+00:00"))
-                age = now - cache_time
-                
-                if self.cache_ttl_days > 0 and age > timedelta(days=self.cache_ttl_days):
-                    stats["expired_queries"] += 1
-                else:
-                    stats["valid_queries"] += 1
-                
-                if stats["oldest_cache"] is None or cache_time < stats["oldest_cache"]:
-                    stats["oldest_cache"] = cache_time
-                if stats["newest_cache"] is None or cache_time > stats["newest_cache"]:
-                    stats["newest_cache"] = cache_time
-            except Exception:
+        # Stats only need metadata, so the candidates are never validated
+        for _, meta in self._scan_cache_files():
+            if meta is None:
                 continue
+            platform, cache_epoch, result_count = meta
+            
+            stats["total_queries"] += 1
+            stats["total_candidates"] += result_count
+            stats["by_platform"][platform] = stats["by_platform"].get(platform, 0) + 1
+            
+            if self._is_expired(cache_epoch, now):
+                stats["expired_queries"] += 1
+            else:
+                stats["valid_queries"] += 1
+            
+            if oldest is None or cache_epoch < oldest:
+                oldest = cache_epoch
+            if newest is None or cache_epoch > newest:
+                newest = cache_epoch
+        
+        # Only the two extremes are turned back into datetimes
+        if oldest is not None:
+            stats["oldest_cache"] = datetime.fromtimestamp(oldest, timezone.utc)
+            stats["newest_cache"] = datetime.fromtimestamp(newest, timezone.utc)
         
         return stats
     
@@ -521,7 +666,6 @@ class PassiveDiscovery:
         Returns:
             Enriched candidates list
         """
-        import os
         from enrich.ipinfo_client import IPInfoClient
         
         ipinfo_token = os.environ.get("IPINFO_TOKEN")
@@ -538,8 +682,13 @@ class PassiveDiscovery:
             cache_ttl_days=30  # IPInfo data is stable, cache for 30 days
         )
         
-        # Get unique IPs
-        unique_ips = list(set(c.ip for c in candidates))
+        # Group candidates by IP (first-seen order); the keys are the unique IPs.
+        # One str-hash per candidate; the grouping is needed to apply results,
+        # so a separate unique-IP pass (e.g. packed ints + np.unique) only adds work.
+        by_ip: Dict[str, List[CandidateHost]] = {}
+        for c in candidates:
+            by_ip.setdefault(c.ip, []).append(c)
+        unique_ips = list(by_ip)
         
         # Bulk lookup
         ip_results = client.bulk_lookup(
@@ -553,9 +702,10 @@ class PassiveDiscovery:
         enriched_at = utc_now_iso()
         cloud_count = 0
         
-        for candidate in candidates:
-            ip_info = ip_results.get(candidate.ip)
-            if ip_info:
+        for ip, ip_info in ip_results.items():
+            if not ip_info:
+                continue
+            for candidate in by_ip.get(ip, ()):
                 candidate.hosting_provider = ip_info.hosting_provider
                 candidate.is_cloud_hosted = ip_info.is_hosting
                 candidate.enriched_at = enriched_at
@@ -583,14 +733,11 @@ class PassiveDiscovery:
                     cloud_count += 1
         
         # Summary
-        providers = {}
-        for c in candidates:
-            if c.hosting_provider:
-                providers[c.hosting_provider] = providers.get(c.hosting_provider, 0) + 1
+        providers = Counter(c.hosting_provider for c in candidates if c.hosting_provider)
         
         print(f"[Enrich] Cloud-hosted: {cloud_count:,} ({cloud_count*100//len(candidates)}%)")
         if providers:
-            top_providers = sorted(providers.items(), key=lambda x: -x[1])[:5]
+            top_providers = providers.most_common(5)
             print(f"[Enrich] Top providers: {', '.join(f'{p}:{n}' for p, n in top_providers)}")
         
         return candidates
@@ -1,7 +1,7 @@
 """Discovery module data models."""
 import hashlib
-from typing import List, Dict, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Literal, TypedDict
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class CandidateHost(BaseModel):
@@ -23,15 +23,13 @@ class CandidateHost(BaseModel):
     enriched_at: Optional[str] = None  # ISO timestamp when enriched
     
     def model_dump(self, **kwargs) -> dict:
-        """Override to exclude None values and empty collections."""
-        kwargs.setdefault('exclude_none', True)
-        data = super().model_dump(**kwargs)
-        # Remove empty collections and default booleans
-        if not data.get('sources'):
-            data.pop('sources', None)
-        if not data.get('is_cloud_hosted'):
-            data.pop('is_cloud_hosted', None)
-        return data
+        """Override to exclude None values and empty collections.
+        
+        Every optional field defaults to None, [] or False, so
+        exclude_defaults drops exactly those in pydantic-core's single pass.
+        """
+        kwargs.setdefault('exclude_defaults', True)
+        return super().model_dump(**kwargs)
     
     # For deduplication
     @property
@@ -44,8 +42,28 @@ class CandidateHost(BaseModel):
         """HTTP URL for this candidate."""
         return f"http://{self.ip}:{self.port}"
     
+    def _covers(self, other: 'CandidateHost') -> bool:
+        """True if merging other would not change self (exact repeat)."""
+        return bool(
+            (not other.last_seen or (self.last_seen is not None and other.last_seen <= self.last_seen))
+            and (self.hostname or not other.hostname)
+            and (self.location or not other.location)
+            and (self.asn or not other.asn)
+            and (self.organization or not other.organization)
+            and (self.hosting_provider or not other.hosting_provider)
+            and (self.is_cloud_hosted or not other.is_cloud_hosted)
+            and (self.enriched_at or not other.enriched_at)
+            and all(src in self.sources for src in other.sources)
+        )
+    
     def merge_with(self, other: 'CandidateHost') -> 'CandidateHost':
-        """Merge data from another candidate (same IP:port)."""
+        """Merge data from another candidate (same IP:port).
+        
+        Returns self unchanged when other adds nothing.
+        """
+        if self._covers(other):
+            return self
+        
         # Combine sources
         all_sources = list(set(self.sources + other.sources))
         
@@ -69,6 +87,56 @@ class CandidateHost(BaseModel):
             is_cloud_hosted=self.is_cloud_hosted or other.is_cloud_hosted,
             enriched_at=self.enriched_at or other.enriched_at
         )
+    
+    def merge_with_inplace(self, other: 'CandidateHost') -> None:
+        """Merge data from another candidate (same IP:port) into this one.
+        
+        Same rules as merge_with(), but mutates self instead of building
+        (and re-validating) a new model for every duplicate.
+        """
+        if self._covers(other):
+            return
+        
+        for source in other.sources:
+            if source not in self.sources:
+                self.sources.append(source)
+        
+        if other.last_seen and (not self.last_seen or other.last_seen > self.last_seen):
+            self.last_seen = other.last_seen
+        
+        self.hostname = self.hostname or other.hostname
+        self.location = self.location or other.location
+        self.asn = self.asn or other.asn
+        self.organization = self.organization or other.organization
+        self.hosting_provider = self.hosting_provider or other.hosting_provider
+        self.is_cloud_hosted = self.is_cloud_hosted or other.is_cloud_hosted
+        self.enriched_at = self.enriched_at or other.enriched_at
+    
+    @staticmethod
+    def merge_group(group: List['CandidateHost']) -> 'CandidateHost':
+        """Merge a group of candidates sharing one IP:port into the first."""
+        merged = group[0]
+        for other in group[1:]:
+            merged.merge_with_inplace(other)
+        return merged
+
+
+
+class DiscoveryHeader(TypedDict):
+    """Top-level fields of a candidates file (the candidates array follows).
+    
+    A TypedDict rather than a BaseModel: it is built from trusted values and
+    serialized directly, so there is nothing to validate.
+    """
+    fingerprint_run_id: Optional[str]
+    discovery_timestamp: str
+    total_candidates: int
+    geographic_distribution: Dict[str, int]
+
+
+# Validates/serializes whole candidate lists in pydantic-core instead of per item.
+# Dump with exclude_defaults=True to match CandidateHost.model_dump() output.
+CANDIDATE_LIST_ADAPTER = TypeAdapter(List[CandidateHost])
 
 
 class QueryCache(BaseModel):
@@ -85,11 +153,18 @@ class QueryCache(BaseModel):
     query_type: str  # e.g., "favicon", "title", "body"
     query_string: str  # The actual query sent to the API
     query_timestamp: str  # ISO timestamp when query was executed
+    query_timestamp_epoch: Optional[int] = None  # Same instant as Unix seconds (absent in older caches)
     result_count: int  # Number of results returned
     candidates: List[CandidateHost] = Field(default_factory=list)
     
     @staticmethod
     def hash_query(platform: str, query_string: str) -> str:
-        """Generate unique hash for a platform + query combination."""
+        """Generate unique hash for a platform + query combination.
+        
+        This is the on-disk cache key (query_<hash>.json), so it must stay
+        stable across releases: changing the algorithm orphans every cached
+        result and re-spends API credits. Hashing one short string per query
+        is negligible next to the API round trip.
+        """
         content = f"{platform}:{query_string}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
@@ -9,7 +9,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from core.models import FingerprintSpec
 from fingerprint.filters import is_query_blacklisted
-from .models import CandidateHost
+from .models import CandidateHost, CANDIDATE_LIST_ADAPTER
 from plugins.discovery import (
     DiscoveryPlugin,
     DiscoveryQuery,
@@ -42,6 +42,12 @@ VERSION_PATTERNS = [
     r'^(alpha|beta|dev|rc|release)\s*\d*$',  # alpha, beta1, rc2
 ]
 
+# All version patterns as one anchored alternation, compiled once
+_VERSION_RE = re.compile("|".join(f"(?:{p})" for p in VERSION_PATTERNS), re.IGNORECASE)
+
+# Title parts too generic to query on their own
+_GENERIC_TITLE_TERMS = frozenset({'home', 'index', 'welcome', 'login', 'dashboard', 'admin'})
+
 # Minimum length for a title part to be considered distinctive
 MIN_TITLE_PART_LENGTH = 3
 
@@ -73,17 +79,11 @@ def _split_title_pattern(title_pattern: str) -> List[str]:
             continue
         
         # Skip if matches version/year patterns
-        is_version = False
-        for pattern in VERSION_PATTERNS:
-            if re.match(pattern, part, re.IGNORECASE):
-                is_version = True
-                break
-        
-        if is_version:
+        if _VERSION_RE.match(part):
             continue
         
         # Skip common generic terms
-        if part.lower() in ['home', 'index', 'welcome', 'login', 'dashboard', 'admin']:
+        if part.lower() in _GENERIC_TITLE_TERMS:
             continue
         
         distinctive.append(part)
@@ -115,6 +115,23 @@ def list_plugins() -> Dict[str, dict]:
     return PluginRegistry.info()
 
 
+def _candidate_fields(host: NormalizedHost) -> dict:
+    """Map a NormalizedHost onto CandidateHost field values."""
+    metadata = host.metadata
+    return {
+        'ip': host.ip,
+        'port': host.port,
+        'hostname': host.hostname,
+        'sources': [host.source],
+        'last_seen': host.last_seen,
+        'location': host.location if host.location else None,
+        'asn': metadata.get('asn'),
+        'organization': metadata.get('org'),
+        'hosting_provider': metadata.get('hosting_provider'),
+        'is_cloud_hosted': metadata.get('is_cloud_hosted', False),
+    }
+
+
 def normalized_host_to_candidate(host: NormalizedHost) -> CandidateHost:
     """Convert a NormalizedHost (from plugin) to CandidateHost (for engine).
     
@@ -126,18 +143,22 @@ def normalized_host_to_candidate(host: NormalizedHost) -> CandidateHost:
     Returns:
         CandidateHost compatible with existing engine
     """
-    return CandidateHost(
-        ip=host.ip,
-        port=host.port,
-        hostname=host.hostname,
-        sources=[host.source],
-        last_seen=host.last_seen,
-        location=host.location if host.location else None,
-        asn=host.metadata.get('asn'),
-        organization=host.metadata.get('org'),
-        hosting_provider=host.metadata.get('hosting_provider'),
-        is_cloud_hosted=host.metadata.get('is_cloud_hosted', False),
-    )
+    return CandidateHost(**_candidate_fields(host))
+
+
+def normalized_hosts_to_candidates(hosts: List[NormalizedHost]) -> List[CandidateHost]:
+    """Convert a plugin's result hosts to CandidateHosts in one batch.
+    
+    Same mapping and validation as normalized_host_to_candidate(), but the
+    whole list is validated in a single pydantic-core call.
+    
+    Args:
+        hosts: NormalizedHosts from a discovery plugin
+        
+    Returns:
+        CandidateHosts in the same order
+    """
+    return CANDIDATE_LIST_ADAPTER.validate_python([_candidate_fields(h) for h in hosts])
 
 
 def fingerprint_to_queries(
@@ -193,10 +214,10 @@ def fingerprint_to_queries(
     
     # Image hash queries (high priority)
     for i, img in enumerate(fingerprint.key_images):
-        if img.hashes.mmh3 or img.hashes.md5:
+        if img.hashes.mmh3 is not None or img.hashes.md5:
             add_query(DiscoveryQuery(
                 query_type=QueryType.IMAGE_HASH,
-                value=str(img.hashes.mmh3) if img.hashes.mmh3 else "",
+                value=str(img.hashes.mmh3) if img.hashes.mmh3 is not None else "",
                 metadata={
                     'source': f'image_{i}',
                     'url': img.url,
@@ -205,49 +226,43 @@ def fingerprint_to_queries(
                 }
             ))
     
-    # Title queries - only from first page signature (usually the most important)
-    # Limit to 2 distinctive title parts max
-    title_count = 0
-    for sig in fingerprint.page_signatures[:2]:  # Max 2 page signatures
-        if sig.title_pattern and title_count < 2:
-            title_parts = _split_title_pattern(sig.title_pattern)
-            for part in title_parts[:2]:  # Max 2 parts per title
-                if title_count >= 2:
-                    break
-                add_query(DiscoveryQuery(
-                    query_type=QueryType.TITLE_PATTERN,
-                    value=part,
-                    metadata={'source': 'title', 'url': sig.url, 'original': sig.title_pattern}
-                ))
-                title_count += 1
-    
-    # Body pattern queries - only the app name or most distinctive patterns
-    # Limit to 2 body patterns max (prefer app name if present)
-    body_count = 0
+    # Title and body queries come from the first 2 page signatures, collected
+    # in one pass: at most 2 distinctive title parts (max 2 per title) and at
+    # most 2 body patterns, preferring patterns that contain the app name
     app_name = fingerprint.app_name.lower() if fingerprint.app_name else ""
+    signatures = fingerprint.page_signatures[:2]
+    titles = []  # (part, sig)
+    bodies = []  # (pattern, sig)
     
-    for sig in fingerprint.page_signatures[:2]:  # Max 2 page signatures
-        for pattern in (sig.body_patterns or []):
-            if body_count >= 2:
-                break
-            # Prioritize patterns containing app name
-            if app_name and app_name in pattern.lower():
-                add_query(DiscoveryQuery(
-                    query_type=QueryType.BODY_PATTERN,
-                    value=pattern,
-                    metadata={'source': 'body', 'url': sig.url}
-                ))
-                body_count += 1
+    for sig in signatures:
+        if sig.title_pattern and len(titles) < 2:
+            title_parts = _split_title_pattern(sig.title_pattern)
+            titles.extend((part, sig) for part in title_parts[:2 - len(titles)])
+        
+        if app_name and len(bodies) < 2:
+            for pattern in (sig.body_patterns or ()):
+                if app_name in pattern.lower():
+                    bodies.append((pattern, sig))
+                    if len(bodies) == 2:
+                        break
     
     # If no body patterns with app name, add first distinctive pattern
-    if body_count == 0:
-        for sig in fingerprint.page_signatures[:1]:
-            for pattern in (sig.body_patterns or [])[:1]:
-                add_query(DiscoveryQuery(
-                    query_type=QueryType.BODY_PATTERN,
-                    value=pattern,
-                    metadata={'source': 'body', 'url': sig.url}
-                ))
+    if not bodies and signatures and signatures[0].body_patterns:
+        bodies.append((signatures[0].body_patterns[0], signatures[0]))
+    
+    for part, sig in titles:
+        add_query(DiscoveryQuery(
+            query_type=QueryType.TITLE_PATTERN,
+            value=part,
+            metadata={'source': 'title', 'url': sig.url, 'original': sig.title_pattern}
+        ))
+    
+    for pattern, sig in bodies:
+        add_query(DiscoveryQuery(
+            query_type=QueryType.BODY_PATTERN,
+            value=pattern,
+            metadata={'source': 'body', 'url': sig.url}
+        ))
     
     # Sort by priority and limit
     raw_queries.sort(
@@ -284,7 +299,7 @@ def search_with_plugin(
         return [], result.error
     
     # Convert to CandidateHost format
-    candidates = [normalized_host_to_candidate(h) for h in result.hosts]
+    candidates = normalized_hosts_to_candidates(result.hosts)
     return candidates, None
 
 
@@ -303,7 +318,7 @@ def search_all_plugins(
         max_workers: Number of concurrent workers
         
     Returns:
-        Tuple of (all candidates, stats dict)
+        Tuple of (candidates merged by IP:port, stats dict of raw hits per plugin)
     """
     # Get plugins to use
     if plugins:
@@ -321,15 +336,18 @@ def search_all_plugins(
     
     print(f"\n[Plugins] Using {len(plugin_instances)} plugins: {[p.name for p in plugin_instances]}")
     
-    all_candidates: List[CandidateHost] = []
+    # Candidates are merged by (ip, port) as results arrive, the same
+    # identity deduplicate_candidates() uses, so repeats never accumulate
+    by_key: Dict[Tuple[str, int], CandidateHost] = {}
     stats = {p.name: 0 for p in plugin_instances}
     
-    # Create work items: (plugin, query) pairs
+    # Create work items: (plugin, query) pairs, asking each plugin once
+    # per distinct query type rather than once per query
+    query_types = {q.query_type for q in queries}
     work_items = []
     for plugin in plugin_instances:
-        for query in queries:
-            if plugin.supports_query_type(query.query_type):
-                work_items.append((plugin, query))
+        supported = {t for t in query_types if plugin.supports_query_type(t)}
+        work_items.extend((plugin, query) for query in queries if query.query_type in supported)
     
     print(f"[Plugins] Executing {len(work_items)} query/plugin combinations...")
     
@@ -343,19 +361,25 @@ def search_all_plugins(
         }
         
         for future in as_completed(futures):
-            plugin, query = futures[future]
+            # Drop the finished future (and the raw result list it holds) once
+            # merged, so only unique hosts stay alive while the rest run
+            plugin, query = futures.pop(future)
             try:
                 candidates, error = future.result()
                 if error:
                     print(f"    [{plugin.name.upper()}] ({query.query_type.value}) ERROR: {error}")
                 else:
                     print(f"    [{plugin.name.upper()}] ({query.query_type.value}) Found: {len(candidates)}")
-                    all_candidates.extend(candidates)
+                    for candidate in candidates:
+                        existing = by_key.setdefault((candidate.ip, candidate.port), candidate)
+                        if existing is not candidate:
+                            existing.merge_with_inplace(candidate)
                     stats[plugin.name] += len(candidates)
             except Exception as e:
                 print(f"    [{plugin.name.upper()}] ({query.query_type.value}) EXCEPTION: {e}")
     
-    print(f"\n[Plugins] Total candidates from plugins: {len(all_candidates)}")
+    all_candidates = list(by_key.values())
+    print(f"\n[Plugins] Total unique candidates from plugins: {len(all_candidates)}")
     return all_candidates, stats
 
 
@@ -370,7 +394,7 @@ def discover_with_plugins(
     This is a high-level function that:
     1. Converts fingerprint to normalized queries
     2. Executes queries across all configured plugins
-    3. Returns aggregated candidates (deduplication should be done by caller)
+    3. Returns aggregated candidates, merged by IP:port
     
     Args:
         fingerprint: The fingerprint to search for
@@ -379,7 +403,7 @@ def discover_with_plugins(
         max_workers: Concurrent workers
         
     Returns:
-        List of candidate hosts (not deduplicated)
+        List of candidate hosts (one per IP:port)
     """
     # Initialize plugins if not done
     init_plugins()
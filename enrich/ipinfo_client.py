@@ -1,24 +1,27 @@
 """IPInfo API client with caching and cloud provider detection."""
 import os
-import json
+import hashlib
 import logging
 import requests
-from typing import Optional, List, Dict
+import orjson
+from typing import Optional, List, Dict, Set, Tuple
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from core.utils import utc_now_iso
+from core.utils import utc_now_iso, write_bytes_atomic
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 from core.debug import debug_print
-from .models import IPInfoResult, IPInfoCache
+from .models import IPInfoResult
 
 # Configure logger
 logger = logging.getLogger("sigint.ipinfo")
 
 
 # Cloud/Hosting provider detection patterns
-# Maps ASN numbers and org name patterns to provider names
+# Maps ASN numbers and org name patterns to provider names. Matching uses
+# the normalized tables derived from this below at import, so changes made
+# at runtime are not seen by _detect_provider.
 PROVIDER_PATTERNS: Dict[str, List[str]] = {
     "AWS": ["amazon", "aws", "as16509", "as14618"],
     "GCP": ["google cloud", "google llc", "as15169", "as396982"],
@@ -58,14 +61,43 @@ HOSTING_ASNS = {
     "AS12876",  # Scaleway
 }
 
+# Inverted index over PROVIDER_PATTERNS, built once at import:
+# ASN tokens ("AS16509") map straight to their provider, so an IP whose
+# ASN is listed resolves with one dict lookup.
+_ASN_TO_PROVIDER: Dict[str, str] = {
+    pattern.upper(): provider
+    for provider, patterns in PROVIDER_PATTERNS.items()
+    for pattern in patterns
+    if pattern[:2].lower() == "as" and pattern[2:].isdigit()
+}
+
+# Every pattern as a (lowercase substring, provider) pair for org-name
+# matching, in PROVIDER_PATTERNS order so the first listed provider still wins.
+# A plain scan beats a multi-pattern automaton here: ~40 short literals
+# against a ~40-char org string is a few hundred nanoseconds of C memchr
+# per IP, and a single-pass matcher reports the leftmost hit, not the
+# first-listed provider.
+_SUBSTRING_PROVIDERS: List[Tuple[str, str]] = [
+    (pattern.lower(), provider)
+    for provider, patterns in PROVIDER_PATTERNS.items()
+    for pattern in patterns
+]
+
+# bulk_lookup lists the cache directory (one scandir per shard) instead of
+# probing each IP's path once it has at least this many IPs to check
+_CACHE_LIST_MIN_IPS = 256
+
 
 class IPInfoClient:
-    """Client for IPInfo.io API with caching and connection pooling."""
+    """Client for IPInfo.io API with caching and connection pooling.
     
-    BASE_URL = "https://ipinfo.io"
+    Results are cached as one JSON file per IP under a hashed shard
+    directory (see _get_cache_path). A lookup is a single open of a known
+    path, bulk_lookup reads those files concurrently, and users can inspect
+    or delete entries with ordinary file tools.
+    """
     
-    # Thread-local storage for sessions
-    _thread_local = None
+    BASE_URL = "https://ipinfo.io"
     
     def __init__(
         self,
@@ -82,73 +114,115 @@ class IPInfoClient:
             cache_ttl_days: Cache TTL in days (0 = no expiration)
             timeout: Request timeout in seconds
         """
-        import threading
-        
         self.token = token or os.environ.get("IPINFO_TOKEN")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl_days = cache_ttl_days
         self.timeout = timeout
-        self._thread_local = threading.local()
+        self._session: Optional[requests.Session] = None
         
         if not self.token:
             print("[IPInfo] Warning: No IPINFO_TOKEN found. Using free tier (limited).")
     
     def _get_session(self) -> requests.Session:
-        """Get or create a thread-local session with connection pooling."""
+        """Get or create the session shared by all worker threads.
+        
+        Every request goes to one host, so a single pool lets workers reuse
+        each other's keep-alive connections instead of each thread opening
+        (and TLS-handshaking) its own. The pool hands out one connection
+        per in-flight request, which makes concurrent get() calls safe.
+        """
         from requests.adapters import HTTPAdapter
         
-        if not hasattr(self._thread_local, 'session'):
+        if self._session is None:
             session = requests.Session()
             if self.token:
                 session.headers["Authorization"] = f"Bearer {self.token}"
             
-            # Mount adapter with connection pooling
-            adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50)
+            # Mount adapter with connection pooling (one host, up to 50 sockets)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=50)
             session.mount("https://", adapter)
             
-            self._thread_local.session = session
+            self._session = session
         
-        return self._thread_local.session
+        return self._session
     
-    def _get_cache_path(self, ip: str) -> Path:
-        """Get cache file path for an IP."""
-        # Use IP as filename (replace dots with underscores)
+    @staticmethod
+    def _cache_file_name(ip: str) -> str:
+        """Get the cache file name for an IP (dots/colons become underscores)."""
         safe_ip = ip.replace(".", "_").replace(":", "_")
-        return self.cache_dir / f"{safe_ip}.json"
+        return f"{safe_ip}.json"
+    
+    def _get_cache_path(self, ip: str) -> Path:
+        """Get cache file path for an IP.
+        
+        Entries are sharded into 256 subdirectories by a hash of the IP so
+        a large campaign doesn't put 100k+ files in one directory.
+        """
+        shard = hashlib.blake2b(ip.encode(), digest_size=1).hexdigest()
+        return self.cache_dir / shard / self._cache_file_name(ip)
+    
+    def _get_legacy_cache_path(self, ip: str) -> Path:
+        """Get the pre-sharding (flat) cache file path for an IP."""
+        return self.cache_dir / self._cache_file_name(ip)
+    
+    def _list_cache_names(self) -> Set[str]:
+        """List the file names of all cache entries, sharded and legacy."""
+        names: Set[str] = set()
+        try:
+            with os.scandir(self.cache_dir) as top:
+                for entry in top:
+                    if entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as shard:
+                            names.update(e.name for e in shard)
+                    else:
+                        names.add(entry.name)
+        except OSError:
+            pass
+        return names
     
     def _load_cache(self, ip: str) -> Optional[IPInfoResult]:
-        """Load cached result for an IP if valid."""
-        cache_path = self._get_cache_path(ip)
-        if not cache_path.exists():
-            return None
+        """Load cached result for an IP if valid.
         
+        A miss costs failed open()s (sharded, then legacy path) rather than
+        separate exists() stats. Entries were validated before _save_cache
+        wrote them and hold only flat scalar fields, so a fresh one is
+        rebuilt with model_construct() instead of being re-validated.
+        """
         try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-            cache = IPInfoCache(**data)
+            try:
+                raw = self._get_cache_path(ip).read_bytes()
+            except FileNotFoundError:
+                # Entries written before sharding stay valid until they expire
+                raw = self._get_legacy_cache_path(ip).read_bytes()
+            data = orjson.loads(raw)
             
             # Check TTL
             if self.cache_ttl_days > 0:
-                cache_time = datetime.fromisoformat(cache.cached_at.replace("Z", "+00:00"))
+                cache_time = datetime.fromisoformat(data["cached_at"].replace("Z", "+00:00"))
                 age = datetime.now(timezone.utc) - cache_time
                 if age > timedelta(days=self.cache_ttl_days):
                     return None
             
-            return cache.result
+            return IPInfoResult.model_construct(**data["result"])
         except Exception:
             return None
     
-    def _save_cache(self, ip: str, result: IPInfoResult):
-        """Save result to cache."""
-        cache = IPInfoCache(
-            ip=ip,
-            result=result,
-            cached_at=utc_now_iso()
-        )
+    def _save_cache(self, ip: str, result: IPInfoResult, cached_at: Optional[str] = None):
+        """Save result to cache.
+        
+        Writes the IPInfoCache layout as compact orjson; the fields are
+        already validated, so no wrapper model is built.
+        
+        Args:
+            ip: IP address the result belongs to
+            result: Result to cache
+            cached_at: ISO timestamp to record (default: now)
+        """
+        payload = {"ip": ip, "result": result.model_dump(), "cached_at": cached_at or utc_now_iso()}
         cache_path = self._get_cache_path(ip)
-        with open(cache_path, 'w') as f:
-            json.dump(cache.model_dump(), f, indent=2)
+        cache_path.parent.mkdir(exist_ok=True)
+        write_bytes_atomic(cache_path, orjson.dumps(payload))
     
     def _detect_provider(self, org: Optional[str], asn: Optional[str]) -> tuple[bool, Optional[str]]:
         """Detect if IP belongs to a hosting provider and which one.
@@ -163,11 +237,15 @@ class IPInfoClient:
         org_lower = (org or "").lower()
         asn_upper = (asn or "").upper()
         
-        # Check each provider pattern
-        for provider, patterns in PROVIDER_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in org_lower or pattern.upper() == asn_upper:
-                    return True, provider
+        # A listed ASN is authoritative, whatever the org name mentions
+        provider = _ASN_TO_PROVIDER.get(asn_upper)
+        if provider:
+            return True, provider
+        
+        # Fall back to org-name substrings
+        for pattern, provider in _SUBSTRING_PROVIDERS:
+            if pattern in org_lower:
+                return True, provider
         
         # Check if ASN is in known hosting ASNs
         if asn_upper in HOSTING_ASNS:
@@ -179,10 +257,8 @@ class IPInfoClient:
         """Extract ASN from org string like 'AS16509 Amazon.com, Inc.'"""
         if not org:
             return None
-        parts = org.split()
-        if parts and parts[0].upper().startswith("AS"):
-            return parts[0].upper()
-        return None
+        first = org.partition(" ")[0].upper()
+        return first if first.startswith("AS") else None
     
     def lookup(self, ip: str, use_cache: bool = True) -> IPInfoResult:
         """Look up IP information.
@@ -200,6 +276,19 @@ class IPInfoClient:
             if cached:
                 return cached
         
+        return self._fetch(ip)
+    
+    def _fetch(self, ip: str, cached_at: Optional[str] = None) -> IPInfoResult:
+        """Fetch IP information from the API and cache the result.
+        
+        Args:
+            ip: IP address to look up
+            cached_at: Cache timestamp to record; bulk_lookup passes one per
+                batch instead of formatting the clock for every IP
+            
+        Returns:
+            IPInfoResult with enrichment data
+        """
         # Make API request using pooled session
         try:
             session = self._get_session()
@@ -213,7 +302,7 @@ class IPInfoClient:
                 return IPInfoResult(ip=ip, company="Rate Limited")
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Parse response
             org = data.get("org")
@@ -221,13 +310,11 @@ class IPInfoClient:
             is_hosting, provider = self._detect_provider(org, asn)
             
             # Extract company name (org without ASN prefix)
-            company = None
-            if org:
-                parts = org.split(maxsplit=1)
-                if len(parts) > 1 and parts[0].upper().startswith("AS"):
-                    company = parts[1]
-                else:
-                    company = org
+            company = org or None
+            if asn:
+                _, sep, rest = org.partition(" ")
+                if sep and rest:
+                    company = rest
             
             result = IPInfoResult(
                 ip=ip,
@@ -246,11 +333,11 @@ class IPInfoClient:
             )
             
             # Cache the result
-            self._save_cache(ip, result)
+            self._save_cache(ip, result, cached_at)
             
             return result
             
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             return IPInfoResult(ip=ip, company=f"Error: {str(e)[:50]}")
     
     def bulk_lookup(
@@ -271,21 +358,26 @@ class IPInfoClient:
         Returns:
             Dictionary mapping IP to IPInfoResult
         """
-        # Deduplicate IPs
-        unique_ips = list(set(ips))
+        # Deduplicate IPs, keeping the caller's order
+        unique_ips = list(dict.fromkeys(ips))
         results: Dict[str, IPInfoResult] = {}
         
-        # Check cache first
-        to_fetch = []
-        cached_count = 0
-        for ip in unique_ips:
-            if use_cache:
-                cached = self._load_cache(ip)
-                if cached:
-                    results[ip] = cached
-                    cached_count += 1
-                    continue
-            to_fetch.append(ip)
+        # Check cache first: reads are independent file I/O, so hydrate on
+        # the pool instead of one stat+open+parse at a time
+        to_read = unique_ips if use_cache else []
+        if len(to_read) >= _CACHE_LIST_MIN_IPS:
+            # One listing of the cache rules out new IPs without an open() each
+            present = self._list_cache_names()
+            to_read = [ip for ip in to_read if self._cache_file_name(ip) in present]
+        
+        if to_read:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for ip, cached in zip(to_read, executor.map(self._load_cache, to_read)):
+                    if cached:
+                        results[ip] = cached
+        
+        cached_count = len(results)
+        to_fetch = [ip for ip in unique_ips if ip not in results]
         
         if cached_count > 0:
             print(f"    [IPInfo] {cached_count} IPs from cache")
@@ -295,9 +387,13 @@ class IPInfoClient:
         
         print(f"    [IPInfo] Fetching {len(to_fetch)} IPs...")
         
-        # Fetch remaining IPs concurrently
+        # Fetch remaining IPs concurrently. Threads, like the rest of SigInt:
+        # ipinfo rate-limits (429) well below what a small pool sustains, and
+        # requests releases the GIL while waiting on the network.
+        self._get_session()  # Build the shared session before workers race for it
+        cached_at = utc_now_iso()  # One timestamp for the whole batch
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(self.lookup, ip, False): ip for ip in to_fetch}
+            futures = {executor.submit(self._fetch, ip, cached_at): ip for ip in to_fetch}
             
             iterator = as_completed(futures)
             if show_progress:
@@ -6,7 +6,9 @@ Uses the cryptography library to parse binary DER certificates.
 import ssl
 import socket
 import hashlib
-from typing import Optional, List, Dict
+import threading
+from collections import OrderedDict
+from typing import List, Dict
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
@@ -22,6 +24,9 @@ try:
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+# Parsed certificates kept per TLSClient (LRU by SHA-256 of the DER)
+_PARSE_CACHE_SIZE = 4096
+
 
 class TLSClient:
     """Client for fetching TLS/SSL certificates.
@@ -37,18 +42,49 @@ class TLSClient:
             timeout: Connection timeout in seconds
         """
         self.timeout = timeout
+        self._context = self._build_context()
+        # Parsed certs by SHA-256 of the DER: CDN fronts, wildcard and
+        # shared-hosting certs are served by many hosts, and a repeat skips
+        # all X.509 work
+        self._parse_cache: "OrderedDict[bytes, TLSInfo]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
         if not CRYPTO_AVAILABLE:
             print("[WARNING] cryptography library not installed. TLS parsing may be limited.")
     
-    def _extract_name_attribute(self, name: 'x509.Name', oid) -> Optional[str]:
-        """Extract an attribute from X.509 Name by OID."""
+    @staticmethod
+    def _build_context() -> ssl.SSLContext:
+        """Build the SSL context shared by every fetch.
+        
+        Certificates are wanted regardless of validity, so nothing is
+        verified and no CA bundle is loaded. Security level 0 keeps
+        handshakes with legacy servers (small keys, SHA-1 signatures)
+        from failing before the cert is seen. The maximum version stays at
+        the library default, so servers that support TLS 1.3 already get
+        its 1-RTT handshake. SSLContext is safe to share across the
+        bulk_fetch worker threads.
+        """
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
         try:
-            attrs = name.get_attributes_for_oid(oid)
-            if attrs:
-                return attrs[0].value
+            context.set_ciphers("ALL:@SECLEVEL=0")
+        except ssl.SSLError:
+            pass  # OpenSSL build without SECLEVEL support: keep defaults
+        return context
+    
+    def _first_attributes(self, name: 'x509.Name') -> Dict['x509.ObjectIdentifier', str]:
+        """Map each OID in an X.509 Name to its first value, in one walk.
+        
+        Replaces a get_attributes_for_oid() call (and its scan) per wanted
+        attribute with a single pass over the name.
+        """
+        values = {}
+        try:
+            for attr in name:
+                values.setdefault(attr.oid, attr.value)
         except Exception:
             pass
-        return None
+        return values
     
     def _parse_san(self, cert: 'x509.Certificate') -> tuple:
         """Extract Subject Alternative Names and email addresses from certificate.
@@ -88,23 +124,44 @@ class TLSClient:
         """Parse a binary DER certificate using cryptography library.
         
         This method extracts certificate data regardless of validity,
-        which is useful for attribution and enrichment.
+        which is useful for attribution and enrichment. Results are
+        memoized per client by the certificate's SHA-256, so hosts serving
+        the same cert share one TLSInfo; treat it as read-only.
         """
         if not CRYPTO_AVAILABLE:
             return TLSInfo(error="cryptography library not installed")
         
+        # The digest is the cache key and the fingerprint, so hash once
+        digest = hashlib.sha256(cert_binary).digest()
+        with self._parse_cache_lock:
+            info = self._parse_cache.get(digest)
+            if info is not None:
+                self._parse_cache.move_to_end(digest)
+                return info
+        
+        info = self._parse_der(cert_binary, digest.hex())
+        with self._parse_cache_lock:
+            self._parse_cache[digest] = info
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return info
+    
+    def _parse_der(self, cert_binary: bytes, fingerprint: str) -> TLSInfo:
+        """Parse DER certificate bytes into TLSInfo (uncached)."""
         try:
             cert = x509.load_der_x509_certificate(cert_binary, default_backend())
             
             # Extract subject info
             subject = cert.subject
-            cn = self._extract_name_attribute(subject, NameOID.COMMON_NAME)
-            subject_org = self._extract_name_attribute(subject, NameOID.ORGANIZATION_NAME)
+            subject_attrs = self._first_attributes(subject)
+            cn = subject_attrs.get(NameOID.COMMON_NAME)
+            subject_org = subject_attrs.get(NameOID.ORGANIZATION_NAME)
             
             # Extract issuer info
             issuer = cert.issuer
-            issuer_cn = self._extract_name_attribute(issuer, NameOID.COMMON_NAME)
-            issuer_org = self._extract_name_attribute(issuer, NameOID.ORGANIZATION_NAME)
+            issuer_attrs = self._first_attributes(issuer)
+            issuer_cn = issuer_attrs.get(NameOID.COMMON_NAME)
+            issuer_org = issuer_attrs.get(NameOID.ORGANIZATION_NAME)
             
             # Get dates
             not_before = cert.not_valid_before_utc if hasattr(cert, 'not_valid_before_utc') else cert.not_valid_before
@@ -120,14 +177,11 @@ class TLSClient:
             is_valid = not_before <= now <= not_after
             
             # Check self-signed (subject == issuer)
-            is_self_signed = (cert.subject == cert.issuer)
+            is_self_signed = (subject == issuer)
             
             # Get SANs and emails
             san, emails = self._parse_san(cert)
             
-            # Calculate fingerprint
-            fingerprint = hashlib.sha256(cert_binary).hexdigest()
-            
             # Serial number
             serial = format(cert.serial_number, 'x').upper()
             
@@ -163,13 +217,11 @@ class TLSClient:
             TLSInfo with certificate details (even for invalid certs)
         """
         try:
-            # Create SSL context that doesn't verify - we want the cert regardless
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            
+            # Shared context doesn't verify - we want the cert regardless.
+            # bulk_fetch callers pass IPs, which getaddrinfo converts
+            # numerically with no DNS query, so only the connect is bounded.
             with socket.create_connection((host, port), timeout=self.timeout) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
+                with self._context.wrap_socket(sock, server_hostname=host) as ssock:
                     # Get binary DER certificate - this always works
                     cert_binary = ssock.getpeercert(binary_form=True)
                     
@@ -220,6 +272,10 @@ class TLSClient:
         
         print(f"    [TLS] Fetching certificates from {len(unique_targets)} hosts...")
         
+        # Threads rather than asyncio, like the rest of SigInt: socket connect
+        # and the ssl handshake release the GIL, and callers only pass
+        # verified/likely hosts, so `workers` (verification's max_workers)
+        # already covers the whole batch in a round or two.
         with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
                 executor.submit(self.fetch_cert, host, port): (host, port)
@@ -1,6 +1,6 @@
 """Export candidate lists to various formats (CSV, JSON, HTML)."""
 import csv
-import json
+from html import escape
 from pathlib import Path
 from typing import List, Dict
 
@@ -63,24 +63,28 @@ def _export_csv(candidates: List[CandidateHost], output_path: Path) -> None:
         "sources"
     ]
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-        writer.writeheader()
-        
+    def rows():
+        """Yield one tuple per candidate, in `columns` order."""
         for c in candidates:
-            row = {
-                "ip": c.ip,
-                "port": c.port,
-                "hostname": c.hostname or "",
-                "country": c.location.get("country", "") if c.location else "",
-                "city": c.location.get("city", "") if c.location else "",
-                "hosting_provider": c.hosting_provider or "",
-                "is_cloud_hosted": c.is_cloud_hosted,
-                "organization": c.organization or "",
-                "asn": c.asn or "",
-                "sources": ",".join(c.sources) if c.sources else ""
-            }
-            writer.writerow(row)
+            location = c.location or {}
+            yield (
+                c.ip,
+                c.port,
+                c.hostname or "",
+                location.get("country", ""),
+                location.get("city", ""),
+                c.hosting_provider or "",
+                c.is_cloud_hosted,
+                c.organization or "",
+                c.asn or "",
+                ",".join(c.sources) if c.sources else "",
+            )
+    
+    # Plain tuples through writerows: no per-row dict for DictWriter to re-index
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows())
     
     print(f"[Export] CSV saved to: {output_path}")
 
@@ -91,17 +95,20 @@ def _export_json(
     geo_distribution: Dict[str, int] = None
 ) -> None:
     """Export candidates to JSON."""
-    from core.utils import utc_now_iso
+    from core.utils import utc_now_iso, write_json_stream
     
-    data = {
+    header = {
         "export_timestamp": utc_now_iso(),
         "total_candidates": len(candidates),
         "geographic_distribution": geo_distribution or {},
-        "candidates": [c.model_dump() for c in candidates]
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Same fields as CandidateHost.model_dump(), serialized per candidate
+    # while writing instead of as one list of dicts
+    write_json_stream(
+        output_path, header, "candidates",
+        (c.model_dump_json(exclude_defaults=True).encode() for c in candidates)
+    )
     
     print(f"[Export] JSON saved to: {output_path}")
 
@@ -114,8 +121,8 @@ def _export_html(
     """Export candidates to HTML."""
     from core.utils import utc_now_iso
     
-    # Build HTML
-    html = f"""<!DOCTYPE html>
+    # Page head, styles, summary and table header
+    header = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -247,51 +254,53 @@ def _export_html(
             <tbody>
 """
     
-    for c in candidates:
-        country = c.location.get("country", "") if c.location else ""
-        provider = c.hosting_provider or ""
-        cloud_class = "cloud" if c.is_cloud_hosted else ""
-        sources = ", ".join(c.sources) if c.sources else ""
+    # Rows are written straight to the file; nothing accumulates in memory
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(header)
         
-        html += f"""                <tr>
+        for c in candidates:
+            country = c.location.get("country", "") if c.location else ""
+            provider = c.hosting_provider or ""
+            cloud_class = "cloud" if c.is_cloud_hosted else ""
+            sources = ", ".join(c.sources) if c.sources else ""
+            
+            # Host-reported values (hostname, org) are untrusted: escape them
+            f.write(f"""                <tr>
                     <td>{c.ip}</td>
                     <td>{c.port}</td>
-                    <td>{c.hostname or '-'}</td>
-                    <td>{country}</td>
-                    <td class="{cloud_class}">{provider}</td>
-                    <td>{c.organization or '-'}</td>
-                    <td class="sources">{sources}</td>
+                    <td>{escape(c.hostname or '-')}</td>
+                    <td>{escape(country)}</td>
+                    <td class="{cloud_class}">{escape(provider)}</td>
+                    <td>{escape(c.organization or '-')}</td>
+                    <td class="sources">{escape(sources)}</td>
                 </tr>
-"""
-    
-    html += """            </tbody>
+""")
+        
+        f.write("""            </tbody>
         </table>
-"""
-    
-    # Add geographic distribution chart
-    if geo_distribution:
-        max_count = max(geo_distribution.values()) if geo_distribution else 1
-        html += """
+""")
+        
+        # Add geographic distribution chart
+        if geo_distribution:
+            max_count = max(geo_distribution.values()) if geo_distribution else 1
+            f.write("""
         <div class="geo-section">
             <h2>Geographic Distribution</h2>
-"""
-        for country, count in sorted(geo_distribution.items(), key=lambda x: -x[1])[:15]:
-            width = int((count / max_count) * 200)
-            html += f"""            <div class="geo-bar">
-                <span class="geo-label">{country}</span>
+""")
+            for country, count in sorted(geo_distribution.items(), key=lambda x: -x[1])[:15]:
+                width = int((count / max_count) * 200)
+                f.write(f"""            <div class="geo-bar">
+                <span class="geo-label">{escape(country)}</span>
                 <div class="geo-fill" style="width: {width}px;"></div>
                 <span>{count}</span>
             </div>
-"""
-        html += "        </div>\n"
-    
-    html += """    </div>
+""")
+            f.write("        </div>\n")
+        
+        f.write("""    </div>
 </body>
 </html>
-"""
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
     
     print(f"[Export] HTML saved to: {output_path}")
 
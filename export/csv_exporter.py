@@ -60,40 +60,46 @@ def export_csv(
         "verified_at"
     ]
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-        writer.writeheader()
-        
+    def rows():
+        """Yield one tuple per result, in `columns` order."""
         for result in results:
-            row = {
-                "url": result.url,  # Full URL with scheme
-                "score": result.score,
-                "classification": result.classification,
-                "ip": result.ip,
-                "port": result.port,
-                "scheme": result.scheme,
-                "hostname": result.hostname or "",
-                "matched_probes": result.matched_probes,
-                "total_probes": result.total_probes,
-                "country": result.location.get("country", "") if result.location else "",
-                "city": result.location.get("city", "") if result.location else "",
-                "hosting_provider": result.hosting_provider or "",
-                "is_cloud_hosted": result.is_cloud_hosted,
-                "organization": result.organization or "",
-                "asn": result.asn or "",
+            location = result.location or {}
+            yield (
+                result.url,  # Full URL with scheme
+                result.score,
+                result.classification,
+                result.ip,
+                result.port,
+                result.scheme,
+                result.hostname or "",
+                result.matched_probes,
+                result.total_probes,
+                location.get("country", ""),
+                location.get("city", ""),
+                result.hosting_provider or "",
+                result.is_cloud_hosted,
+                result.organization or "",
+                result.asn or "",
                 # TLS certificate info (for attribution)
-                "tls_common_name": result.tls_common_name or "",
-                "tls_subject_org": result.tls_subject_org or "",
-                "tls_issuer": result.tls_issuer or "",
-                "tls_issuer_org": result.tls_issuer_org or "",
-                "tls_valid": result.tls_valid if result.tls_valid is not None else "",
-                "tls_self_signed": result.tls_self_signed if result.tls_self_signed is not None else "",
-                "tls_san": ";".join(result.tls_san) if result.tls_san else "",
-                "tls_emails": ";".join(result.tls_emails) if result.tls_emails else "",
-                "sources": ",".join(result.sources),
-                "verified_at": result.verified_at or ""
-            }
-            writer.writerow(row)
+                result.tls_common_name or "",
+                result.tls_subject_org or "",
+                result.tls_issuer or "",
+                result.tls_issuer_org or "",
+                result.tls_valid if result.tls_valid is not None else "",
+                result.tls_self_signed if result.tls_self_signed is not None else "",
+                ";".join(result.tls_san) if result.tls_san else "",
+                ";".join(result.tls_emails) if result.tls_emails else "",
+                ",".join(result.sources),
+                result.verified_at or "",
+            )
+    
+    # Plain tuples through writerows: no per-row dict for DictWriter to re-index.
+    # The stdlib writer stays even for large reports: Arrow's CSV writer
+    # formats bools/None differently, so output would change with row count.
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows())
     
     print(f"[Export] CSV saved to: {output_path}")
     print(f"         Rows: {len(results)}")
@@ -1,7 +1,9 @@
 """Main export engine."""
-import json
 from pathlib import Path
 from typing import List, Literal, Optional
+import orjson
+from core.formatting import get_app_slug
+from core.utils import write_json_stream
 from verify.models import VerificationReport
 from .csv_exporter import export_csv
 from .html_exporter import export_html
@@ -44,8 +46,7 @@ class ExportEngine:
         """
         if not base_name:
             # Generate from app name and run ID
-            safe_name = "".join(c if c.isalnum() else "_" for c in report.app_name.lower())
-            base_name = f"{safe_name}_{report.fingerprint_run_id}"
+            base_name = f"{get_app_slug(report.app_name)}_{report.fingerprint_run_id}"
         
         exported_files: List[Path] = []
         
@@ -83,7 +84,7 @@ class ExportEngine:
         # Sort by score
         results = sorted(results, key=lambda r: r.score, reverse=True)
         
-        output_data = {
+        header = {
             "fingerprint_run_id": report.fingerprint_run_id,
             "app_name": report.app_name,
             "verification_started": report.verification_started,
@@ -97,11 +98,13 @@ class ExportEngine:
                 "unlikely": sum(1 for r in results if r.classification == "unlikely"),
                 "no_match": sum(1 for r in results if r.classification == "no_match"),
             },
-            "results": [r.model_dump() for r in results]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+        # Results are serialized one at a time as they are written, so no
+        # list of result dicts (or whole-document buffer) is built. Go through
+        # model_dump(): its override adds `url` and drops empty fields, which
+        # model_dump_json() would bypass.
+        write_json_stream(output_path, header, "results", (orjson.dumps(r.model_dump()) for r in results))
         
         print(f"[Export] JSON saved to: {output_path}")
         print(f"         Results: {len(results)}")
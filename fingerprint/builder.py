@@ -40,12 +40,12 @@ class ProbePlanBuilder:
         order = 0
         
         # Priority 1: Favicon hash (most reliable)
-        if spec.favicon and spec.favicon.hashes and spec.favicon.hashes.mmh3:
+        if spec.favicon and spec.favicon.hashes and spec.favicon.hashes.mmh3 is not None:
             order += 1
             # Include alternative MMH3 hashes if present
             expected_hash = {"hash_type": "mmh3", "value": str(spec.favicon.hashes.mmh3)}
             if spec.favicon.hashes.mmh3_alt:
-                expected_hash["alt_values"] = spec.favicon.hashes.mmh3_alt
+                expected_hash["alt_values"] = [str(h) for h in spec.favicon.hashes.mmh3_alt]
             
             # Use the actual favicon URL from the spec (LLM-discovered or fallback)
             favicon_url = spec.favicon.url or "/favicon.ico"
@@ -75,7 +75,7 @@ class ProbePlanBuilder:
         
         # Priority 3: Key image hashes
         for idx, img in enumerate(spec.key_images):
-            if img.hashes and img.hashes.mmh3:
+            if img.hashes and img.hashes.mmh3 is not None:
                 order += 1
                 steps.append(ProbeStep(
                     order=order,
@@ -148,6 +148,13 @@ BACKEND_ONLY_PATTERNS = [
     r'__pycache__',
 ]
 
+# Each pattern list as one alternation, compiled once at import. An
+# alternation matches/searches wherever any of its members would, so these
+# are drop-in replacements for looping re.match/re.search over the lists.
+_GENERIC_MATCH_RE = re.compile("|".join(f"(?:{p})" for p in GENERIC_PATTERNS))
+_GENERIC_SEARCH_RE = re.compile("|".join(f"(?:{p})" for p in GENERIC_PATTERNS), re.IGNORECASE)
+_BACKEND_ONLY_RE = re.compile("|".join(f"(?:{p})" for p in BACKEND_ONLY_PATTERNS), re.IGNORECASE)
+
 
 def is_query_blacklisted(value: str) -> bool:
     """Check if a query value is too generic to be useful.
@@ -172,11 +179,7 @@ def is_query_blacklisted(value: str) -> bool:
         return True
     
     # Check if value matches generic patterns
-    for pattern in GENERIC_PATTERNS:
-        if re.match(pattern, value_lower):
-            return True
-    
-    return False
+    return _GENERIC_MATCH_RE.match(value_lower) is not None
 
 
 def filter_generic_patterns(analysis: Dict) -> Dict:
@@ -198,13 +201,12 @@ def filter_generic_patterns(analysis: Dict) -> Dict:
             return True
         
         # Check against generic pattern list
-        for generic in GENERIC_PATTERNS:
-            if re.search(generic, pattern, re.IGNORECASE):
-                # BUT: if pattern also contains app name, keep it
-                if app_name and len(app_name) > 3:
-                    if app_name.lower() in pattern.lower():
-                        return False  # Keep it - has app name
-                return True
+        if _GENERIC_SEARCH_RE.search(pattern):
+            # BUT: if pattern also contains app name, keep it
+            if app_name and len(app_name) > 3:
+                if app_name.lower() in pattern.lower():
+                    return False  # Keep it - has app name
+            return True
         
         return False
     
@@ -215,9 +217,8 @@ def filter_generic_patterns(analysis: Dict) -> Dict:
         text_lower = text.lower()
         
         # Check for backend-only keywords
-        for backend_pattern in BACKEND_ONLY_PATTERNS:
-            if re.search(backend_pattern, text, re.IGNORECASE):
-                return True
+        if _BACKEND_ONLY_RE.search(text):
+            return True
         
         # Check for common backend-only phrases
         backend_phrases = [
@@ -33,6 +33,8 @@ def configure_logging(verbose: bool = False):
     # Set SIGINT_DEBUG env var so debug_print utility works
     if debug_mode:
         os.environ["SIGINT_DEBUG"] = "1"
+        from core.debug import reset_debug
+        reset_debug()
     
     level = logging.DEBUG if debug_mode else logging.WARNING
     
@@ -50,23 +52,15 @@ def configure_logging(verbose: bool = False):
 def main():
     """Main entry point - routes to subcommands."""
     from cli.args import parse_args
-    from cli.commands import (
-        cmd_fingerprint,
-        cmd_discover,
-        cmd_verify,
-        cmd_export,
-        cmd_run,
-        cmd_config
-    )
     
-    # Command router
+    # Command router (handlers live in cli.commands, imported on demand)
     commands = {
-        "fingerprint": cmd_fingerprint,
-        "discover": cmd_discover,
-        "verify": cmd_verify,
-        "export": cmd_export,
-        "run": cmd_run,
-        "config": cmd_config,
+        "fingerprint": "cmd_fingerprint",
+        "discover": "cmd_discover",
+        "verify": "cmd_verify",
+        "export": "cmd_export",
+        "run": "cmd_run",
+        "config": "cmd_config",
     }
     
     # Parse arguments
@@ -77,9 +71,10 @@ def main():
     configure_logging(verbose)
     
     # Route to appropriate command
-    handler = commands.get(args.command)
-    if handler:
-        exit_code = handler(args)
+    handler_name = commands.get(args.command)
+    if handler_name:
+        import cli.commands
+        exit_code = getattr(cli.commands, handler_name)(args)
         sys.exit(exit_code)
     else:
         print(f"Unknown command: {args.command}")
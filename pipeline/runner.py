@@ -1,15 +1,15 @@
 """Pipeline runner - orchestrates all phases."""
-import json
 import traceback
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
-from core.utils import utc_now_iso
+from core.utils import utc_now_iso, write_json_stream
 
 from cli.args import SigIntConfig
 from core.models import FingerprintOutput
 from core.formatting import get_app_slug, print_fingerprint_summary, print_section_header
-from discover.models import CandidateHost
+from discover.models import CandidateHost, DiscoveryHeader
 from verify.models import VerificationReport
 
 
@@ -73,6 +73,10 @@ class PipelineRunner:
     def run(self) -> PipelineResult:
         """Run the complete pipeline.
         
+        Phase outputs are handed to the next phase as in-memory models; the
+        files saved along the way are audit copies and are never re-read (or
+        re-validated) within the same run.
+        
         Returns:
             PipelineResult with outputs and status
         """
@@ -269,9 +273,7 @@ class PipelineRunner:
         Returns:
             Loaded FingerprintOutput
         """
-        with open(fingerprint_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return FingerprintOutput(**data)
+        return FingerprintOutput.model_validate_json(Path(fingerprint_path).read_bytes())
     
     def _save_fingerprint(self, fingerprint: FingerprintOutput) -> Path:
         """Save fingerprint to disk."""
@@ -284,8 +286,7 @@ class PipelineRunner:
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(fingerprint.model_dump(), f, indent=2)
+        output_path.write_bytes(fingerprint.model_dump_json(indent=2, exclude_none=True).encode())
         
         print(f"\n[✓] Fingerprint saved to: {output_path}")
         return output_path
@@ -303,28 +304,24 @@ class PipelineRunner:
         candidates_dir.mkdir(parents=True, exist_ok=True)
         output_path = candidates_dir / f"{app_slug}_{run_id}_candidates.json"
         
-        # Calculate geographic distribution
-        geo_dist = {}
-        for candidate in candidates:
-            country = candidate.location.get("country", "Unknown") if candidate.location else "Unknown"
-            geo_dist[country] = geo_dist.get(country, 0) + 1
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "fingerprint_run_id": run_id,
-                "discovery_timestamp": utc_now_iso(),
-                "total_candidates": len(candidates),
-                "geographic_distribution": dict(sorted(geo_dist.items(), key=lambda x: -x[1])),
-                "candidates": [c.model_dump() for c in candidates]
-            }, f, indent=2)
+        # Calculate geographic distribution (sorted once, most common first)
+        geo_counts = Counter((c.location or {}).get("country", "Unknown") for c in candidates).most_common()
+        
+        header = DiscoveryHeader(
+            fingerprint_run_id=run_id,
+            discovery_timestamp=utc_now_iso(),
+            total_candidates=len(candidates),
+            geographic_distribution=dict(geo_counts)
+        )
+        write_json_stream(output_path, header, "candidates", (c.model_dump_json(exclude_defaults=True).encode() for c in candidates))
         
         print(f"\n[✓] Found {len(candidates)} candidates")
         print(f"[✓] Saved to: {output_path}")
         
         # Print top countries
-        if geo_dist:
+        if geo_counts:
             print(f"\nGeographic distribution:")
-            for country, count in sorted(geo_dist.items(), key=lambda x: -x[1])[:10]:
+            for country, count in geo_counts[:10]:
                 print(f"  {country}: {count}")
         
         print("=" * 70)
@@ -1,11 +1,10 @@
 """Main verification engine for Phase 3."""
 import time
-import json
 import socket
 import re
 from typing import List, Optional, Dict
 from pathlib import Path
-from core.utils import utc_now_iso
+from core.utils import utc_now_iso, write_json
 from core.debug import debug_print
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
@@ -653,8 +652,7 @@ class VerificationEngine:
             if include_all or result.score > 0:
                 output_data["results"].append(result.model_dump())
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
+        write_json(output_path, output_data)
         
         print(f"\n[✓] Verification report saved to: {output_path}")
         print(f"    Total results: {len(output_data['results'])} (including all scores)")
@@ -5,19 +5,21 @@ import logging
 import hashlib
 import mmh3
 import base64
-from io import BytesIO
 import requests
-from PIL import Image
 import imagehash
 
 from core.models import ProbeStep
 from core.debug import debug_print
+from core.utils import calculate_favicon_mmh3, calculate_phash
 from config import Defaults
 from .models import ProbeResult
 
 # Configure logger
 logger = logging.getLogger("sigint.probes")
 
+# Page <title> extractor, shared by every page_signature check
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
+
 
 class ProbeExecutor:
     """Executes individual probe steps against a target.
@@ -392,9 +394,14 @@ class ProbeExecutor:
         # Calculate actual hash
         content = response.content
         if hash_type == "mmh3":
-            # Shodan-style: base64 encode then MMH3
-            b64_content = base64.encodebytes(content)
-            actual_hash = str(mmh3.hash(b64_content))
+            # Shodan-style: base64 encode then MMH3 (memoized per favicon);
+            # probe plans carry the values as strings, so compare as ints
+            actual_hash = calculate_favicon_mmh3(content)
+            try:
+                all_expected = {int(v) for v in all_expected}
+            except (TypeError, ValueError):
+                result.error = f"Invalid MMH3 value in probe: {expected_value}"
+                return result
         elif hash_type == "sha256":
             actual_hash = hashlib.sha256(content).hexdigest()
         elif hash_type == "md5":
@@ -441,8 +448,7 @@ class ProbeExecutor:
         try:
             if hash_type == "phash":
                 # Perceptual hash - allows for minor image variations
-                img = Image.open(BytesIO(content))
-                actual_hash = str(imagehash.phash(img))
+                actual_hash = calculate_phash(content)
                 result.actual = f"phash:{actual_hash}"
                 
                 # For perceptual hash, check hamming distance (allow small differences)
@@ -472,9 +478,9 @@ class ProbeExecutor:
             elif hash_type == "mmh3":
                 # MurmurHash3 (Shodan-compatible)
                 encoded = base64.b64encode(content).decode()
-                actual_hash = str(mmh3.hash(encoded))
+                actual_hash = mmh3.hash(encoded)
                 result.actual = f"mmh3:{actual_hash}"
-                result.matched = bool(actual_hash == expected_value)
+                result.matched = bool(actual_hash == int(expected_value))
             else:
                 result.error = f"Unknown hash type: {hash_type}"
                 
@@ -524,22 +530,18 @@ class ProbeExecutor:
         # Check title pattern
         if probe.expected_title_pattern:
             matches_expected.append(f"title:/{probe.expected_title_pattern}/")
-            title_match = re.search(
-                r"<title[^>]*>([^<]*)</title>",
-                content,
-                re.IGNORECASE
-            )
+            title_match = _TITLE_RE.search(content)
             if title_match:
                 actual_title = title_match.group(1)
-                if re.search(probe.expected_title_pattern, actual_title, re.IGNORECASE):
+                if probe.compiled_title().search(actual_title):
                     matches_found.append(f"title:{actual_title[:50]}")
                     points_earned += Defaults.PROBE_POINTS_TITLE
         
         # Check body patterns - each pattern match earns points independently
         if probe.expected_body_patterns:
-            for pattern in probe.expected_body_patterns:
+            for pattern, compiled in zip(probe.expected_body_patterns, probe.compiled_body()):
                 matches_expected.append(f"body:/{pattern[:30]}/")
-                if re.search(re.escape(pattern), content, re.IGNORECASE):
+                if compiled.search(content):
                     matches_found.append(f"body:/{pattern[:30]}/")
                     points_earned += Defaults.PROBE_POINTS_BODY
         